@@ -1,3 +1,15 @@
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Final
+
+# Shared header suffixes
+_BOOKS = " in the books of TM for clients and in the books of CM for TM (Pro) and in the books of CM for CP"
+_RCV = " received by TM from clients and by CM from TM(Pro) and from CPs"
+_RET_TM = " Retained by TM"
+_PLC_CM = " placed with CM"
+_RET_CM = " retained with CM"
+_PLC_NCL = " placed with NCL"
+
 A = "Date"
 B = "Clearing Member PAN"
 C = "Trading member PAN"
@@ -7,64 +19,105 @@ F = "Client PAN"
 G = "Account Type"
 H = "Segment Indicator"
 I = "UCC Code"
-J = "Financial Ledger balance-A in the books of TM for clients and in the books of CM for TM (Pro) and in the books of CM for CP"
-K = "Financial Ledger balance (clear)-B in the books of TM for clients and in the books of CM for TM (Pro) and in the books of CM for CP"
-L = "Peak Financial Ledger Balance (Clear)-C in the books of TM for clients and in the books of CM for TM (Pro) and in the books of CM for CP"
+J = "Financial Ledger balance-A" + _BOOKS
+K = "Financial Ledger balance (clear)-B" + _BOOKS
+L = "Peak Financial Ledger Balance (Clear)-C" + _BOOKS
+# M keeps "TM (Pro)" with a space as in the current report header; N..S and BB use "TM(Pro)"
 M = "Bank Guarantee (BG) received by TM from clients and by CM from TM (Pro) and from CPs"
-N = "Fixed Deposit Receipt (FDR) received by TM from clients and by CM from TM(Pro) and from CPs"
-O = "Approved Securities Cash Component received by TM from clients and by CM from TM(Pro) and from CPs"
-P = "Approved Securities Non-cash component received by TM from clients and by CM from TM(Pro) and from CPs"
-Q = "Non-Approved Securities received by TM from clients and by CM from TM(Pro) and from CPs"
-R = "Value of CC approved Commodities received by TM from clients and by CM from TM(Pro) and from CPs"
-S = "Other collaterals received by TM from clients and by CM from TM(Pro) and from CPs"
+N = "Fixed Deposit Receipt (FDR)" + _RCV
+O = "Approved Securities Cash Component" + _RCV
+P = "Approved Securities Non-cash component" + _RCV
+Q = "Non-Approved Securities" + _RCV
+R = "Value of CC approved Commodities" + _RCV
+S = "Other collaterals" + _RCV
 T = "Credit entry in ledger in lieu of EPI for clients / TM Pro"
 U = "Pool Account for clients / TM Pro"
-V = "Cash Retained by TM"
-W = "Bank Guarantee (BG) Retained by TM"
-X = "Fixed Deposit Receipt (FDR) Retained by TM"
-Y = "Approved Securities Cash Component Retained by TM"
-Z = "Approved Securities Non-cash component Retained by TM"
-AA = "Non-Approved Securities Retained by TM"
-AB = "Value of CC approved Commodities Retained by TM"
-AC = "Other Collaterals Retained by TM"
-AD = "Cash placed with CM"
-AE = "Bank Guarantee (BG) placed with CM"
-AF = "Fixed deposit receipt (FDR) placed with CM"
-AG = "Approved Securities Cash Component placed with CM"
-AH = "Approved Securities Non-cash component placed with CM"
-AI = "Non-Approved Securities placed with CM"
-AJ = "Value of CC approved Commodities placed with CM"
-AK = "Other Collaterals placed with CM"
+V = "Cash" + _RET_TM
+W = "Bank Guarantee (BG)" + _RET_TM
+X = "Fixed Deposit Receipt (FDR)" + _RET_TM
+Y = "Approved Securities Cash Component" + _RET_TM
+Z = "Approved Securities Non-cash component" + _RET_TM
+AA = "Non-Approved Securities" + _RET_TM
+AB = "Value of CC approved Commodities" + _RET_TM
+AC = "Other Collaterals" + _RET_TM
+AD = "Cash" + _PLC_CM
+AE = "Bank Guarantee (BG)" + _PLC_CM
+AF = "Fixed deposit receipt (FDR)" + _PLC_CM
+AG = "Approved Securities Cash Component" + _PLC_CM
+AH = "Approved Securities Non-cash component" + _PLC_CM
+AI = "Non-Approved Securities" + _PLC_CM
+AJ = "Value of CC approved Commodities" + _PLC_CM
+AK = "Other Collaterals" + _PLC_CM
 AL = "Cash Retained with CM"
-AM = "Bank Guarantee (BG) retained with CM"
-AN = "Fixed deposit receipt (FDR) retained with CM"
-AO = "Approved Securities Cash Component retained with CM"
-AP = "Approved Securities Non-cash component retained with CM"
-AQ = "Non-Approved Securities retained with CM"
-AR = "Value of CC approved Commodities retained with CM"
+AM = "Bank Guarantee (BG)" + _RET_CM
+AN = "Fixed deposit receipt (FDR)" + _RET_CM
+AO = "Approved Securities Cash Component" + _RET_CM
+AP = "Approved Securities Non-cash component" + _RET_CM
+AQ = "Non-Approved Securities" + _RET_CM
+AR = "Value of CC approved Commodities" + _RET_CM
 AS = "Other Collaterals Retained with CM"
-AT = "Cash placed with NCL"
-AU = "Bank Guarantee (BG) placed with NCL"
-AV = "Fixed deposit receipt (FDR) placed with NCL"
-AW = "Approved Securities Cash Component placed with NCL"
-AX = "Approved Securities Non-cash component placed with NCL"
-AY = "Value of CC approved Commodities placed with NCL"
+AT = "Cash" + _PLC_NCL
+AU = "Bank Guarantee (BG)" + _PLC_NCL
+AV = "Fixed deposit receipt (FDR)" + _PLC_NCL
+AW = "Approved Securities Cash Component" + _PLC_NCL
+AX = "Approved Securities Non-cash component" + _PLC_NCL
+AY = "Value of CC approved Commodities" + _PLC_NCL
 AZ = "MTF /Non MTF indicator/Reason Code"
 BA = "Uncleared Receipts"
-BB = "Govt Securities / T-bills received by TM from clients and by CM from TM(Pro) and from CPs"
-BC = "Govt Securities /T-bills Retained by TM"
-BD = "Govt Securities/T-bills placed with CM"
-BE = "Govt Securities/T bills retained with CM"
-BF = "Govt Securities/T bills placed with NCL"
-BG = "Bank Guarantee (BG) Funded portion retained with CM"
-BH = "Bank Guarantee (BG) Non funded portion retained with CM"
-BI = "Bank Guarantee (BG) Funded portion placed with NCL"
-BJ = "Bank Guarantee (BG) Non funded portion placed with NCL"
+BB = "Govt Securities / T-bills" + _RCV
+BC = "Govt Securities /T-bills" + _RET_TM
+BD = "Govt Securities/T-bills" + _PLC_CM
+BE = "Govt Securities/T bills" + _RET_CM
+BF = "Govt Securities/T bills" + _PLC_NCL
+BG = "Bank Guarantee (BG) Funded portion" + _RET_CM
+BH = "Bank Guarantee (BG) Non funded portion" + _RET_CM
+BI = "Bank Guarantee (BG) Funded portion" + _PLC_NCL
+BJ = "Bank Guarantee (BG) Non funded portion" + _PLC_NCL
 BK = "Settlement Amount"
 BL = "Unclaimed/Unsettled Client Funds"
 BM = "Cash Collateral for MTF positions"
 
-segregation_headers = [A,B,C,D,E,F,G,H,I,J,K,L,M,N,O,P,Q,R,S,T,U,V,W,X,Y,Z,AA,AB,AC,AD,AE,AF,AG,AH,AI,AJ,AK,AL,AM,AN,AO,AP,AQ,AR,AS,AT,AU,AV,AW,AX,AY,AZ,BA,BB,BC,BD,BE,BF,BG,BH,BI,BJ,BK,BL,BM]
+def _column_letter(index):
+    """Spreadsheet column letter for a 0-based position: 0 -> "A", 26 -> "AA"."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+# Output column i is the header bound to the spreadsheet letter of i, so the
+# A..BM constants above are the only place the column order is written down.
+_COLUMN_COUNT = 65  # A..BM
+_COLUMN_NAMES = tuple(_column_letter(i) for i in range(_COLUMN_COUNT))
+
+SEGREGATION_HEADERS: Final[tuple[str, ...]] = tuple(globals()[name] for name in _COLUMN_NAMES)
+segregation_headers = SEGREGATION_HEADERS
+
+# Column letter -> position in a segregation row, e.g. Col.K == 10
+Col = IntEnum("Col", [(name, i) for i, name in enumerate(_COLUMN_NAMES)], module=__name__)
+
+# Header text -> position, for callers that only have the header string
+HEADER_INDEX: Final = MappingProxyType({name: i for i, name in enumerate(SEGREGATION_HEADERS)})
+
+# Source column -> columns that receive a copy of its value
+FANOUT_K = (AD, AV)
+FANOUT_O = (AG, AW)
+FANOUT_P = (AH, AX)
+FANOUTS = {K: FANOUT_K, O: FANOUT_O, P: FANOUT_P}
+
+# Sec pledge final effective value is pasted into all three Govt Securities columns
+PLEDGE_FANOUT = (BB, BD, BF)
+
+def scatter(row, cols, value):
+    """Write the same value into every column of cols."""
+    for col in cols:
+        row[col] = value
+
+def apply_fanouts(row):
+    """Copy each FANOUTS source column of row into its target columns."""
+    for src, targets in FANOUTS.items():
+        scatter(row, targets, row[src])
 
 SRNO = "Sr No"
 CPCODE = "CP CODE"
@@ -82,11 +135,40 @@ POST_HAIRCUT = "POST HAIRCUT"
 
 GSEC_HEADER = [SRNO,CPCODE,SEGMENT,ISIN,PLEDGE_TYPE,SEC_NAME,MATURITY_DATE,PRICE,QUANTITY,MKT_VALUE,HAIRCUT,HAIRCUT_VALUE,POST_HAIRCUT]
 
-CO_FIXED_DATA = [[
-    "08-09-2025","AACCO4820B","AACCO4820B","DBSBK0000189","AAGCD0792B","", "C","CO","", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0","0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "NA","0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "NA", "0"],
-[
-    "08-09-2025","AACCO4820B","AACCO4820B","ICICI0006090","AAJCN6787F","", "C","CO","", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0","0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "NA","0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "NA", "0"]
-]
+# Only these G-Sec columns feed the segregation report
+GSEC_USED_COLUMNS = frozenset({CPCODE, SEGMENT, PLEDGE_TYPE, POST_HAIRCUT})
+
+# Placeholder written into text columns that have no value (AZ, BL)
+NA = "NA"
+
+_ZERO = 0
+_CO_TEMPLATE = (_ZERO,) * len(SEGREGATION_HEADERS)
+
+# Only the cells that differ from the all-zero template
+_CO_OVERRIDES = (
+    {Col.A: "08-09-2025", Col.B: "AACCO4820B", Col.C: "AACCO4820B", Col.D: "DBSBK0000189", Col.E: "AAGCD0792B",
+     Col.F: "", Col.G: "C", Col.H: "CO", Col.I: "", Col.AZ: NA, Col.BL: NA},
+    {Col.A: "08-09-2025", Col.B: "AACCO4820B", Col.C: "AACCO4820B", Col.D: "ICICI0006090", Col.E: "AAJCN6787F",
+     Col.F: "", Col.G: "C", Col.H: "CO", Col.I: "", Col.AZ: NA, Col.BL: NA},
+)
+
+def _apply(template, overrides):
+    row = list(template)
+    for col, value in overrides.items():
+        row[col] = value
+    return row
+
+def co_fixed_data():
+    """Return fresh copies of the fixed CO rows, in segregation_headers order."""
+    return [_apply(_CO_TEMPLATE, overrides) for overrides in _CO_OVERRIDES]
+
+def __getattr__(name):
+    # CO_FIXED_DATA is built on first access rather than at import
+    if name == "CO_FIXED_DATA":
+        value = co_fixed_data()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # F_CPMaster_data : FO
 # X_CPMaster_data : CD
@@ -111,10 +193,7 @@ O # CashEquivalent
 P # NonCash
 
 
-# same columns data copy in 
-K # -> AD AND AV
-O # -> AG AND AW
-P # -> AH AND AX
+# same columns data copy in -> see FANOUTS
 
 # File - F_90123_SEC_PLEDGE_09092025_02 | row - 219 col - GSEC below header -> this col for calculation = Client/CP code, ISIN, 
 # this below formula for extra client code which is extra percentage
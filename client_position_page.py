@@ -6,119 +6,280 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import os
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+
+_JSON_IO_BUFFER = 64 * 1024
+
+
+def _read_json(path):
+    """Read and parse a JSON file in a single buffered read"""
+    with open(path, "rb", buffering=_JSON_IO_BUFFER) as f:
+        return json.loads(f.read())
+
+
+def _write_json(path, data):
+    """
+    Serialize data to a JSON file (indented, as the file is hand-edited).
+    The payload is written to a sibling .tmp file, fsynced,
+    and swapped in with os.replace, so readers never see a half-written
+    file and a crash cannot leave an empty one behind.
+    """
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb", buffering=_JSON_IO_BUFFER) as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# Shared widget fonts/colours, built once instead of per widget
+_FONT_9 = ('Arial', 9)
+_FONT_9_BOLD = ('Arial', 9, 'bold')
+_FONT_10 = ('Arial', 10)
+_FONT_10_BOLD = ('Arial', 10, 'bold')
+_FONT_11_BOLD = ('Arial', 11, 'bold')
+_FONT_12 = ('Arial', 12)
+_FONT_12_BOLD = ('Arial', 12, 'bold')
+_FONT_14_BOLD = ('Arial', 14, 'bold')
+_FONT_16_BOLD = ('Arial', 16, 'bold')
+_TEXT_COLOR = '#2c3e50'
+
+
+class CPRow:
+    """One CP code: the settings saved to master_passwords.json plus UI selection"""
+    
+    __slots__ = ('cp_code', 'password', 'mode', 'add_total', 'selected')
+    
+    def __init__(self, cp_code, password='123', mode='7z', add_total=False, selected=False):
+        self.cp_code = cp_code
+        self.password = password
+        self.mode = mode
+        self.add_total = add_total
+        self.selected = selected
+    
+    def copy(self):
+        return CPRow(self.cp_code, self.password, self.mode, self.add_total, self.selected)
+    
+    def to_json(self):
+        """On-disk array entry; 'selected' is UI state only and is not saved"""
+        return {
+            'cp_code': self.cp_code,
+            'password': self.password,
+            'mode': self.mode,
+            'add_total': self.add_total
+        }
+
+
+def _intern(value):
+    """Share one string object between rows repeating the same value"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_array_rows(data):
+    """Rows from the array format written by this page: [{cp_code, password, ...}]"""
+    rows = []
+    for item in data:
+        cp_code_value = item.get('cp_code', '')
+        # CP codes are always kept as str, so lookups can compare them directly
+        cp_code_value = '' if cp_code_value is None else str(cp_code_value)
+        
+        rows.append(CPRow(
+            cp_code_value,
+            _intern(item.get('password', '123')),
+            _intern(item.get('mode', '7z')),
+            item.get('add_total', False)
+        ))
+    return rows
+
+
+def _parse_object_rows(data):
+    """Rows from the older object format: {cp_code: {password, ...}}"""
+    rows = []
+    # JSON object keys are always str already
+    for cp_code, config in data.items():
+        rows.append(CPRow(
+            cp_code,
+            _intern(config.get('password', '123')),
+            _intern(config.get('mode', '7z')),
+            config.get('add_total', False)
+        ))
+    return rows
+
+
+# json.loads only ever yields exact list/dict for the top level, so dispatch on type
+_ROW_PARSERS = {list: _parse_array_rows, dict: _parse_object_rows}
+
+
+def parse_cp_codes(data):
+    """
+    Build CP code rows from parsed master_passwords.json content.
+    Rows start unselected; any other top-level value yields no rows.
+    """
+    parser = _ROW_PARSERS.get(type(data))
+    return parser(data) if parser is not None else []
+
+
+def search_key(cp_code, password):
+    """
+    Case-folded haystack for searching a row by CP code or password. The
+    unit separator keeps a match from spanning the two fields.
+    """
+    return f"{cp_code}\x1f{password}".casefold()
+
+
+def filter_cp_codes(search_keys, filter_text):
+    """
+    Return the positions in search_keys matching filter_text.
+    search_keys holds one search_key() string per row; an empty filter
+    matches everything.
+    """
+    needle = filter_text.casefold()
+    if not needle:
+        return set(range(len(search_keys)))
+    return {i for i, hay in enumerate(search_keys) if needle in hay}
+
 
 def load_passwords(json_file):
     """Load CP code → password mapping from JSON"""
-    with open(json_file, "r") as f:
-        data = json.load(f)
+    data = _read_json(json_file)
     return {item["cp_code"]: item["password"] for item in data}
 
 
+# Default CP codes (hardcoded) - used for initial creation and reset.
+# Kept as (cp_code, password) pairs; every default uses mode "7z" without a
+# total row. Row dicts are only built when ClientPositionPage._defaults() is
+# first called, i.e. when the JSON file is missing or the user resets.
+_DEFAULT_CP_CODES = (
+    ("DBSBK0000033", "AAGCD0792B"),
+    ("DBSBK0000036", "AAGCD0792B"),
+    ("DBSBK0000038", "AAGCD0792B"),
+    ("DBSBK0000041", "AAGCD0792B"),
+    ("DBSBK0000042", "AAGCD0792B"),
+    ("DBSBK0000044", "AAGCD0792B"),
+    ("DBSBK0000043", "AAGCD0792B"),
+    ("DBSBK0000049", "AAGCD0792B"),
+    ("DBSBK0000050", "AAGCD0792B"),
+    ("DBSBK0000051", "AAGCD0792B"),
+    ("DBSBK0000052", "AAGCD0792B"),
+    ("KOTBK0000475", "AACCO2383D"),
+    ("DBSBK0000057", "AARCA6399L"),
+    ("ORBIS0000721", "AAHCD1353P"),
+    ("90072", "AAVCS8275R"),
+    ("ICICI0005102", "AAHCD2926Q"),
+    ("BNPP00000389", "AAICB6686J"),
+    ("DBSBK0000074", "AAGCD0792B"),
+    ("DBSBK0000077", "AAHCC9973C"),
+    ("KOTBK0000718", "AADCF4059J"),
+    ("DBSBK0000079", "AAICD0896J"),
+    ("DBSBK0000178", "AAICD1968M"),
+    ("DBSBK0000179", "AAGCD0792B"),
+    ("BNPP00000458", "AAICD2891H"),
+    ("BNPP00000459", "AAICD3412C"),
+    ("ICICI0005162", "AAHCD7958E"),
+    ("DBSBK0000189", "AAGCD0792B"),
+    ("KOTBK0001080", "AADCF4059J"),
+    ("ICICI0005402", "AAGCE6929F"),
+    ("BNPP00000494", "AAWCA0001C"),
+    ("DBSBK0000214", "AAGCD0792B"),
+    ("DBSBK0000216", "AAGCD0792B"),
+    ("BNPP00000488", "AAICD7821M"),
+    ("BNPP00000480", "AAICD6359G"),
+    ("OHMDO0000001", "AACCA2197H"),
+    ("BNPP00000540", "AAJCD5624K"),
+    ("DBSBK0000229", "AAJCD6205G"),
+    ("BNPP00000535", "AAJCD4991K"),
+    ("DBSBK0000192", "AAGCD0792B"),
+    ("DBSBK0000217", "AAGCD0792B"),
+    ("DBSBK0000246", "AAGCD0792B"),
+    ("DBSBK0000247", "AAGCD0792B"),
+    ("OHMDO0000002", "AAECC6885A"),
+    ("A3854825I", "AADPD3226A"),
+    ("OHMDO0000003", "AABCH5042B"),
+    ("DBSBK0000232", "AAGCD0792B"),
+    ("DBSBK0000231", "AAJCD6048F"),
+    ("ICICI0005101", "AAHCD5316Q"),
+    ("DBSBK0000228", "AAJCD6049E"),
+    ("BNPP00000499", "AAICD9377Q"),
+    ("BNPP00000475", "AAICD5720H"),
+    ("ICICI0005164", "AABCI6920P"),
+    ("KOTBK0001453", "AAKTA2588D"),
+    ("DBSBK0000276", "AAKCD4198F"),
+    ("ORBIS0007660", "AAICD5720H"),
+    ("KOTBK0001482", "AAKCT7857R"),
+    ("KOTBK0001479", "AAKCT7815R"),
+    ("KOTBK0001480", "AAKCT7812J"),
+    ("KOTBK0001481", "AAKCT7855P"),
+    ("DBSBK0000289", "AAKCT7813K"),
+    ("DBSBK0000286", "AAKCT7814Q"),
+    ("DBSBK0000288", "AAKCT7856Q"),
+    ("DBSBK0000287", "AAKCT7854N"),
+    ("DBSBK0000285", "AAKCD6244Q"),
+    ("OHMDO0000004", "AAHCD0576E"),
+    ("U8399487I", "AGBPJ7494C"),
+    ("ICICI0005271", "AADCC2348D"),
+    ("KOTBK0001329", "AAATF9362J"),
+    ("DBSBK0000299", "AAKCD7324B"),
+    ("DBSBK0000300", "AAKCD7414N"),
+    ("DBSBK0000354", "AALCD1141K"),
+    ("ECASL0000538", "ABMCS3199L"),
+    ("V6148852I", "ARJPK3191L"),
+    ("DBSBK0000353", "AALCD1140J"),
+    ("EP286656I", "AQCPA0001F"),
+    ("S8274288I", "ATJPD3231G"),
+    ("DBSBK0000348", "AAETD0225G"),
+    ("DBSBK0000356", "AAETG6735E"),
+    ("KOTBK0001706", "AALTA0989R"),
+    ("ICICI0006265", "AAMCC1280F"),
+    ("DBSBK0000416", "AAGCL1184K"),
+    ("Z5739353I", "BEHPB0322L"),
+    ("ECASL0000724", "ABITS1146C"),
+    ("DBSBK0000360", "AALCT2614F"),
+    ("DBSBK0000361", "AALCT2613C"),
+    ("DBNK00009051", "AACTM3577A"),
+    ("DBNK00009053", "AACTM3577A"),
+    ("DBSBK0000380", "AALCD2920N"),
+    ("DBSBK0000381", "AALCD2919D"),
+    ("DBSBK0000397", "AALCD3274D"),
+    ("DBSBK0000456", "AAGCL3082L"),
+    ("DBSBK0000398", "AAJCN6787F"),
+    ("ICICI0006090", "AAJCN6787F"),
+    ("KOTBK0001688", "AAKCT7857R"),
+    ("DBNK00009050", "AACTM3577A"),
+    ("DBNK00009529", "AACTM3577A"),
+    ("DBSBK0000458", "AALCD7016M"),
+    ("DBSBK0000455", "AALCD6828M"),
+    ("DBSBK0000444", "AALCD5956G"),
+)
+
+
 class ClientPositionPage:
     """Client Position Report page with CP Code Management"""
     
-    # Default CP codes (hardcoded) - used for initial creation and reset
-    DEFAULT_CP_CODES = [
-        {"cp_code": "DBSBK0000033", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000036", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000038", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000041", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000042", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000044", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000043", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000049", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000050", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000051", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000052", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0000475", "password": "AACCO2383D", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000057", "password": "AARCA6399L", "mode": "7z", "add_total": False},
-        {"cp_code": "ORBIS0000721", "password": "AAHCD1353P", "mode": "7z", "add_total": False},
-        {"cp_code": "90072", "password": "AAVCS8275R", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0005102", "password": "AAHCD2926Q", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000389", "password": "AAICB6686J", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000074", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000077", "password": "AAHCC9973C", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0000718", "password": "AADCF4059J", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000079", "password": "AAICD0896J", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000178", "password": "AAICD1968M", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000179", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000458", "password": "AAICD2891H", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000459", "password": "AAICD3412C", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0005162", "password": "AAHCD7958E", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000189", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001080", "password": "AADCF4059J", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0005402", "password": "AAGCE6929F", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000494", "password": "AAWCA0001C", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000214", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000216", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000488", "password": "AAICD7821M", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000480", "password": "AAICD6359G", "mode": "7z", "add_total": False},
-        {"cp_code": "OHMDO0000001", "password": "AACCA2197H", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000540", "password": "AAJCD5624K", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000229", "password": "AAJCD6205G", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000535", "password": "AAJCD4991K", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000192", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000217", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000246", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000247", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "OHMDO0000002", "password": "AAECC6885A", "mode": "7z", "add_total": False},
-        {"cp_code": "A3854825I", "password": "AADPD3226A", "mode": "7z", "add_total": False},
-        {"cp_code": "OHMDO0000003", "password": "AABCH5042B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000232", "password": "AAGCD0792B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000231", "password": "AAJCD6048F", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0005101", "password": "AAHCD5316Q", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000228", "password": "AAJCD6049E", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000499", "password": "AAICD9377Q", "mode": "7z", "add_total": False},
-        {"cp_code": "BNPP00000475", "password": "AAICD5720H", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0005164", "password": "AABCI6920P", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001453", "password": "AAKTA2588D", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000276", "password": "AAKCD4198F", "mode": "7z", "add_total": False},
-        {"cp_code": "ORBIS0007660", "password": "AAICD5720H", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001482", "password": "AAKCT7857R", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001479", "password": "AAKCT7815R", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001480", "password": "AAKCT7812J", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001481", "password": "AAKCT7855P", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000289", "password": "AAKCT7813K", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000286", "password": "AAKCT7814Q", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000288", "password": "AAKCT7856Q", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000287", "password": "AAKCT7854N", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000285", "password": "AAKCD6244Q", "mode": "7z", "add_total": False},
-        {"cp_code": "OHMDO0000004", "password": "AAHCD0576E", "mode": "7z", "add_total": False},
-        {"cp_code": "U8399487I", "password": "AGBPJ7494C", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0005271", "password": "AADCC2348D", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001329", "password": "AAATF9362J", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000299", "password": "AAKCD7324B", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000300", "password": "AAKCD7414N", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000354", "password": "AALCD1141K", "mode": "7z", "add_total": False},
-        {"cp_code": "ECASL0000538", "password": "ABMCS3199L", "mode": "7z", "add_total": False},
-        {"cp_code": "V6148852I", "password": "ARJPK3191L", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000353", "password": "AALCD1140J", "mode": "7z", "add_total": False},
-        {"cp_code": "EP286656I", "password": "AQCPA0001F", "mode": "7z", "add_total": False},
-        {"cp_code": "S8274288I", "password": "ATJPD3231G", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000348", "password": "AAETD0225G", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000356", "password": "AAETG6735E", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001706", "password": "AALTA0989R", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0006265", "password": "AAMCC1280F", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000416", "password": "AAGCL1184K", "mode": "7z", "add_total": False},
-        {"cp_code": "Z5739353I", "password": "BEHPB0322L", "mode": "7z", "add_total": False},
-        {"cp_code": "ECASL0000724", "password": "ABITS1146C", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000360", "password": "AALCT2614F", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000361", "password": "AALCT2613C", "mode": "7z", "add_total": False},
-        {"cp_code": "DBNK00009051", "password": "AACTM3577A", "mode": "7z", "add_total": False},
-        {"cp_code": "DBNK00009053", "password": "AACTM3577A", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000380", "password": "AALCD2920N", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000381", "password": "AALCD2919D", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000397", "password": "AALCD3274D", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000456", "password": "AAGCL3082L", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000398", "password": "AAJCN6787F", "mode": "7z", "add_total": False},
-        {"cp_code": "ICICI0006090", "password": "AAJCN6787F", "mode": "7z", "add_total": False},
-        {"cp_code": "KOTBK0001688", "password": "AAKCT7857R", "mode": "7z", "add_total": False},
-        {"cp_code": "DBNK00009050", "password": "AACTM3577A", "mode": "7z", "add_total": False},
-        {"cp_code": "DBNK00009529", "password": "AACTM3577A", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000458", "password": "AALCD7016M", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000455", "password": "AALCD6828M", "mode": "7z", "add_total": False},
-        {"cp_code": "DBSBK0000444", "password": "AALCD5956G", "mode": "7z", "add_total": False},
-    ]
+    _DEFAULT_COUNT = len(_DEFAULT_CP_CODES)
+    _TREE_PAGE_SIZE = 200  # rows attached to the tree at a time
+    _defaults_cache = None
+    _default_rows_cache = None
+    
+    @classmethod
+    def _defaults(cls):
+        """Default CP code rows, built from _DEFAULT_CP_CODES on first use"""
+        if cls._defaults_cache is None:
+            cls._defaults_cache = [
+                {"cp_code": cp_code, "password": password, "mode": "7z", "add_total": False}
+                for cp_code, password in _DEFAULT_CP_CODES
+            ]
+        return cls._defaults_cache
+    
+    @classmethod
+    def _default_rows(cls):
+        """Fresh, unselected in-memory copies of the default CP code rows"""
+        if cls._default_rows_cache is None:
+            cls._default_rows_cache = [CPRow(**row) for row in cls._defaults()]
+        return [row.copy() for row in cls._default_rows_cache]
     
     def __init__(self, parent, on_process_click, on_collateral_sync=None, bg_color="#B5D1B1"):
         self.parent = parent
@@ -127,21 +288,67 @@ class ClientPositionPage:
         self.on_process_click = on_process_click
         self.on_collateral_sync = on_collateral_sync
         self.cp_codes_data = []  # Store CP codes with checkbox states and passwords
+        self._cp_index = {}  # cp_code -> row in cp_codes_data
+        self._tree_items = []  # (tree iid, row) for every CP code, attached or not
+        self._created_iids = set()  # iids that have a Tk item; the rest are created when first shown
+        self._iid_counter = count()
+        self._iid_by_cp = {}  # cp_code -> tree iid
+        self._displayed = {}  # tree iid -> (values, tags) drawn, or to draw once created
+        self._row_by_iid = {}  # tree iid -> row in cp_codes_data
+        self._data_version = 0  # bumped whenever rows are added, removed or edited
+        self._tree_state = None  # (filter_text, _data_version) the tree currently shows
+        self._attached_iids = set()  # iids currently shown by the search filter
+        self._unattached_matches = []  # matching iids beyond the rows attached so far
+        self._search_keys = []  # search_key() per row, parallel to _tree_items
+        self._search_after_id = None  # pending debounced search
+        self._suspend_search_trace = False  # set while search_var is changed programmatically
+        self._selected_count = 0  # rows with 'selected' set, kept in step with toggles
+        self._loaded_signature = None  # (mtime_ns, size) of the file behind _loaded_rows
+        self._loaded_rows = []
+        # Auto-saves run on one worker thread so they stay ordered and off the Tk loop
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._save_future = None
+        # The worker never touches Tk: it posts (path, status, error) here and
+        # the Tk thread reports them (polled while a save is outstanding)
+        self._save_outcomes = queue.Queue()
+        self._save_poll_id = None
+        self._cp_form = None  # reused add/edit dialog widgets, see _cp_code_dialog
+        self._bulk_form = None  # reused bulk update dialog widgets
+        self._save_after_id = None  # pending debounced auto-save
+        self._save_dirty = False  # rows changed since the last auto-save was queued
+        self._save_status = None  # status line to confirm once the queued auto-save lands
         self.master_json_path = "master_passwords.json"
         self.cash_collateral_path = tk.StringVar()
         self.create_widgets()
+        # Don't lose a debounced auto-save when the window closes
+        self.frame.bind('<Destroy>', self._on_destroy)
         self.load_cp_codes_from_json()  # Load on init
     
+    def _on_destroy(self, event):
+        if event.widget is self.frame:
+            if self._save_poll_id is not None:
+                self.frame.after_cancel(self._save_poll_id)
+                self._save_poll_id = None
+            self._flush_auto_save()
+    
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
     
     def pack_forget(self):
         self.frame.pack_forget()
     
+    def _label(self, parent, text, font, fg=_TEXT_COLOR, **kwargs):
+        """Page-coloured label"""
+        return tk.Label(parent, text=text, font=font, bg=self.bg_color, fg=fg, **kwargs)
+    
+    def _button(self, parent, text, command, bg, font, **kwargs):
+        """Flat white-on-colour button used throughout the page"""
+        return tk.Button(parent, text=text, command=command, bg=bg, fg='white',
+                         font=font, relief=tk.FLAT, **kwargs)
+    
     def create_widgets(self):
         # Header
-        header_label = tk.Label(self.frame, text="Client Position Report", 
-                               font=('Arial', 16, 'bold'), bg=self.bg_color, fg='#2c3e50')
+        header_label = self._label(self.frame, "Client Position Report", _FONT_16_BOLD)
         header_label.pack(pady=8)
         
         # Main container with two columns
@@ -155,66 +362,58 @@ class ClientPositionPage:
         
         # File inputs section
         file_section = tk.LabelFrame(left_frame, text="📁 File Selection", 
-                                     font=('Arial', 11, 'bold'), bg=self.bg_color, 
-                                     fg='#2c3e50', padx=10, pady=10)
+                                     font=_FONT_11_BOLD, bg=self.bg_color, 
+                                     fg=_TEXT_COLOR, padx=10, pady=10)
         file_section.pack(fill=tk.X, pady=(0, 15))
         
         self.client_position_path = tk.StringVar()
         self.output_path = tk.StringVar()
         
         # Client Position File
-        tk.Label(file_section, text="Client Position File:", font=('Arial', 10, 'bold'), 
-                bg=self.bg_color, fg='#2c3e50').pack(anchor='w', pady=(5, 2))
+        self._label(file_section, "Client Position File:", _FONT_10_BOLD).pack(anchor='w', pady=(5, 2))
         
         file_frame1 = tk.Frame(file_section, bg=self.bg_color)
         file_frame1.pack(fill=tk.X, pady=(0, 10))
         
         tk.Entry(file_frame1, textvariable=self.client_position_path, 
-                font=('Arial', 9), width=25).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Button(file_frame1, text="📂", command=lambda: self._browse_file(self.client_position_path),
-                 bg='#3498db', fg='white', font=('Arial', 9, 'bold'), 
-                 relief=tk.FLAT, padx=8).pack(side=tk.LEFT, padx=(5, 0))
+                font=_FONT_9, width=25).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._button(file_frame1, "📂", lambda: self._browse_file(self.client_position_path),
+                     '#3498db', _FONT_9_BOLD, padx=8).pack(side=tk.LEFT, padx=(5, 0))
         
         # Optional Cash Collateral file
-        tk.Label(file_section, text="Cash Collateral File (Optional):", font=('Arial', 10, 'bold'),
-                bg=self.bg_color, fg='#2c3e50').pack(anchor='w', pady=(5, 2))
+        self._label(file_section, "Cash Collateral File (Optional):", _FONT_10_BOLD).pack(anchor='w', pady=(5, 2))
 
         file_frame3 = tk.Frame(file_section, bg=self.bg_color)
         file_frame3.pack(fill=tk.X, pady=(0, 10))
 
         tk.Entry(file_frame3, textvariable=self.cash_collateral_path,
-                font=('Arial', 9), width=25).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Button(file_frame3, text="📂", command=lambda: self._browse_file(self.cash_collateral_path),
-                 bg='#3498db', fg='white', font=('Arial', 9, 'bold'),
-                 relief=tk.FLAT, padx=8).pack(side=tk.LEFT, padx=(5, 0))
-        tk.Button(file_frame3, text="⚡ Sync", command=self._trigger_collateral_sync,
-                 bg='#1abc9c', fg='white', font=('Arial', 9, 'bold'),
-                 relief=tk.FLAT, padx=8).pack(side=tk.LEFT, padx=(5, 0))
+                font=_FONT_9, width=25).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._button(file_frame3, "📂", lambda: self._browse_file(self.cash_collateral_path),
+                     '#3498db', _FONT_9_BOLD, padx=8).pack(side=tk.LEFT, padx=(5, 0))
+        self._button(file_frame3, "⚡ Sync", self._trigger_collateral_sync, '#1abc9c', _FONT_9_BOLD,
+                     padx=8).pack(side=tk.LEFT, padx=(5, 0))
 
         # Output Folder (placed last)
-        tk.Label(file_section, text="Output Folder:", font=('Arial', 10, 'bold'), 
-                bg=self.bg_color, fg='#2c3e50').pack(anchor='w', pady=(5, 2))
+        self._label(file_section, "Output Folder:", _FONT_10_BOLD).pack(anchor='w', pady=(5, 2))
         
         file_frame2 = tk.Frame(file_section, bg=self.bg_color)
         file_frame2.pack(fill=tk.X)
         
         tk.Entry(file_frame2, textvariable=self.output_path, 
-                font=('Arial', 9), width=25).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Button(file_frame2, text="📂", command=lambda: self._browse_folder(self.output_path),
-                 bg='#3498db', fg='white', font=('Arial', 9, 'bold'), 
-                 relief=tk.FLAT, padx=8).pack(side=tk.LEFT, padx=(5, 0))
+                font=_FONT_9, width=25).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._button(file_frame2, "📂", lambda: self._browse_folder(self.output_path),
+                     '#3498db', _FONT_9_BOLD, padx=8).pack(side=tk.LEFT, padx=(5, 0))
         
         # Process button
-        process_btn = tk.Button(left_frame, text="🚀 Process Client Position\nReport", 
-                               command=self.on_process_click, bg='#27ae60', fg='white', 
-                               font=('Arial', 12, 'bold'), relief=tk.FLAT, 
-                               padx=20, pady=15, wraplength=200)
+        process_btn = self._button(left_frame, "🚀 Process Client Position\nReport",
+                                   self.on_process_click, '#27ae60', _FONT_12_BOLD,
+                                   padx=20, pady=15, wraplength=200)
         process_btn.pack(pady=20, fill=tk.X)
         
         # Info section
         info_frame = tk.LabelFrame(left_frame, text="ℹ️ Information", 
-                                  font=('Arial', 10, 'bold'), bg=self.bg_color, 
-                                  fg='#2c3e50', padx=10, pady=10)
+                                  font=_FONT_10_BOLD, bg=self.bg_color, 
+                                  fg=_TEXT_COLOR, padx=10, pady=10)
         info_frame.pack(fill=tk.BOTH, expand=True)
         
         info_text = (
@@ -224,7 +423,7 @@ class ClientPositionPage:
             "• Use CRUD buttons to manage\n"
             "• Save changes to JSON file"
         )
-        tk.Label(info_frame, text=info_text, font=('Arial', 9), 
+        tk.Label(info_frame, text=info_text, font=_FONT_9, 
                 bg=self.bg_color, fg='#34495e', justify=tk.LEFT).pack(anchor='w')
         
         # Right side - CP Code Management
@@ -235,48 +434,48 @@ class ClientPositionPage:
         header_frame = tk.Frame(right_frame, bg=self.bg_color)
         header_frame.pack(fill=tk.X, pady=(0, 10))
         
-        tk.Label(header_frame, text="CP Code Management", 
-                font=('Arial', 14, 'bold'), bg=self.bg_color, fg='#2c3e50').pack(side=tk.LEFT)
+        self._label(header_frame, "CP Code Management", _FONT_14_BOLD).pack(side=tk.LEFT)
         
         # CRUD Buttons
         crud_frame = tk.Frame(header_frame, bg=self.bg_color)
         crud_frame.pack(side=tk.RIGHT)
         
-        tk.Button(crud_frame, text="➕ Add", command=self.add_cp_code,
-                 bg='#3498db', fg='white', font=('Arial', 9, 'bold'), 
-                 relief=tk.FLAT, padx=12, pady=5).pack(side=tk.LEFT, padx=2)
+        self._button(crud_frame, "➕ Add", self.add_cp_code, '#3498db', _FONT_9_BOLD,
+                     padx=12, pady=5).pack(side=tk.LEFT, padx=2)
         
-        tk.Button(crud_frame, text="✏️ Edit", command=self.edit_cp_code,
-                 bg='#f39c12', fg='white', font=('Arial', 9, 'bold'), 
-                 relief=tk.FLAT, padx=12, pady=5).pack(side=tk.LEFT, padx=2)
+        self._button(crud_frame, "✏️ Edit", self.edit_cp_code, '#f39c12', _FONT_9_BOLD,
+                     padx=12, pady=5).pack(side=tk.LEFT, padx=2)
         
-        tk.Button(crud_frame, text="🗑️ Delete", command=self.delete_cp_code,
-                 bg='#e74c3c', fg='white', font=('Arial', 9, 'bold'), 
-                 relief=tk.FLAT, padx=12, pady=5).pack(side=tk.LEFT, padx=2)
+        self._button(crud_frame, "🗑️ Delete", self.delete_cp_code, '#e74c3c', _FONT_9_BOLD,
+                     padx=12, pady=5).pack(side=tk.LEFT, padx=2)
         
-        tk.Button(crud_frame, text="🧹 Delete All", command=self.delete_all_cp_codes,
-                 bg='#c0392b', fg='white', font=('Arial', 9, 'bold'),
-                 relief=tk.FLAT, padx=12, pady=5).pack(side=tk.LEFT, padx=2)
+        self._button(crud_frame, "🧹 Delete All", self.delete_all_cp_codes, '#c0392b', _FONT_9_BOLD,
+                     padx=12, pady=5).pack(side=tk.LEFT, padx=2)
         
         # Search and filter
         search_frame = tk.Frame(right_frame, bg=self.bg_color)
         search_frame.pack(fill=tk.X, pady=(0, 8))
         
-        tk.Label(search_frame, text="🔍", font=('Arial', 12), 
+        tk.Label(search_frame, text="🔍", font=_FONT_12, 
                 bg=self.bg_color).pack(side=tk.LEFT, padx=(0, 5))
         
         self.search_var = tk.StringVar()
         self.search_var.trace_add('write', self._on_search)
         search_entry = tk.Entry(search_frame, textvariable=self.search_var, 
-                               font=('Arial', 10), width=30)
+                               font=_FONT_10, width=30)
         search_entry.pack(side=tk.LEFT, padx=(0, 15))
         
         # Selection count label
         self.selection_label = tk.Label(search_frame, text="Selected: 0 / 0", 
-                                       font=('Arial', 10, 'bold'), 
+                                       font=_FONT_10_BOLD, 
                                        bg=self.bg_color, fg='#27ae60')
         self.selection_label.pack(side=tk.RIGHT)
         
+        # Outcome of the last add/edit/delete/bulk update, shown instead of a popup
+        self.status_label = tk.Label(search_frame, text="", font=_FONT_9,
+                                     bg=self.bg_color, fg='#7f8c8d')
+        self.status_label.pack(side=tk.RIGHT, padx=(0, 15))
+        
         # Datatable frame with scrollbar (limited height to show buttons below)
         table_container = tk.Frame(right_frame, bg=self.bg_color)
         table_container.pack(fill=tk.BOTH, expand=True)
@@ -307,7 +506,8 @@ class ClientPositionPage:
         # Add scrollbars
         vsb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
         hsb = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self._tree_vsb = vsb
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=hsb.set)
         
         # Grid layout for tree and scrollbars
         self.tree.grid(row=0, column=0, sticky='nsew')
@@ -317,6 +517,10 @@ class ClientPositionPage:
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
         
+        # Configure tags for visual feedback (static, so set up once)
+        self.tree.tag_configure('selected', background='#e8f5e9', font=_FONT_9_BOLD)
+        self.tree.tag_configure('unselected', background='white', font=_FONT_9)
+        
         # Bind click event for checkbox toggle
         self.tree.bind('<Button-1>', self._on_tree_click)
         self.tree.bind('<Double-1>', self.edit_cp_code)
@@ -329,25 +533,20 @@ class ClientPositionPage:
         button_frame = tk.Frame(table_container, bg=self.bg_color)
         button_frame.pack(fill=tk.X, pady=(8, 5), side=tk.TOP)
         
-        tk.Button(button_frame, text="✓ Select All", command=self._select_all,
-                 bg='#3498db', fg='white', font=('Arial', 10), 
-                 relief=tk.FLAT, padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
+        self._button(button_frame, "✓ Select All", self._select_all, '#3498db', _FONT_10,
+                     padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
         
-        tk.Button(button_frame, text="✗ Deselect All", command=self._deselect_all,
-                 bg='#95a5a6', fg='white', font=('Arial', 10), 
-                 relief=tk.FLAT, padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
+        self._button(button_frame, "✗ Deselect All", self._deselect_all, '#95a5a6', _FONT_10,
+                     padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
 
-        tk.Button(button_frame, text="⚙ Update Mode/Total", command=self.bulk_update_all,
-                 bg='#d35400', fg='white', font=('Arial', 10, 'bold'),
-                 relief=tk.FLAT, padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
+        self._button(button_frame, "⚙ Update Mode/Total", self.bulk_update_all, '#d35400', _FONT_10_BOLD,
+                     padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
         
-        tk.Button(button_frame, text="🔄 Reset to Default", command=self.reset_to_default,
-                 bg='#9b59b6', fg='white', font=('Arial', 10), 
-                 relief=tk.FLAT, padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
+        self._button(button_frame, "🔄 Reset to Default", self.reset_to_default, '#9b59b6', _FONT_10,
+                     padx=15, pady=6).pack(side=tk.LEFT, padx=(0, 5))
         
-        tk.Button(button_frame, text="💾 Save Changes", command=self.save_to_json,
-                 bg='#16a085', fg='white', font=('Arial', 10, 'bold'), 
-                 relief=tk.FLAT, padx=20, pady=6).pack(side=tk.RIGHT)
+        self._button(button_frame, "💾 Save Changes", self.save_to_json, '#16a085', _FONT_10_BOLD,
+                     padx=20, pady=6).pack(side=tk.RIGHT)
     
     def _browse_file(self, var):
         """Browse for file"""
@@ -382,46 +581,28 @@ class ClientPositionPage:
     def load_cp_codes_from_json(self):
         """Load CP codes from master_passwords.json - creates with defaults if not exists"""
         try:
+            # Don't read the file back while an auto-save is still writing it.
+            # A save still in its debounce window is dropped, not flushed: the
+            # file may have been updated by someone else since (collateral
+            # sync) and the older rows must not overwrite it. Callers that
+            # change the file call flush_pending_save() first.
+            self._wait_for_pending_save(flush=False)
+            
             # If file doesn't exist, create it with default CP codes
-            if not os.path.exists(self.master_json_path):
+            try:
+                st = os.stat(self.master_json_path)
+            except FileNotFoundError:
                 self._create_default_json_file()
                 return  # _create_default_json_file will load data
             
-            # File exists, load it
-            with open(self.master_json_path, 'r') as f:
-                data = json.load(f)
-            
-            self.cp_codes_data = []
-            
-            # Handle array format
-            if isinstance(data, list):
-                for item in data:
-                    cp_code_value = item.get('cp_code', '')
-                    # Ensure CP code is stored as string
-                    if cp_code_value is not None:
-                        cp_code_value = str(cp_code_value)
-                    
-                    self.cp_codes_data.append({
-                        'cp_code': cp_code_value,
-                        'password': item.get('password', '123'),
-                        'mode': item.get('mode', '7z'),
-                        'add_total': item.get('add_total', False),
-                        'selected': False  # Default unchecked
-                    })
-            # Handle object format
-            elif isinstance(data, dict):
-                for cp_code, config in data.items():
-                    # Ensure CP code is stored as string
-                    cp_code_str = str(cp_code) if cp_code is not None else ''
-                    
-                    self.cp_codes_data.append({
-                        'cp_code': cp_code_str,
-                        'password': config.get('password', '123'),
-                        'mode': config.get('mode', '7z'),
-                        'add_total': config.get('add_total', False),
-                        'selected': False  # Default unchecked
-                    })
+            # File exists - only parse it again if it changed since the last load
+            signature = (st.st_mtime_ns, st.st_size)
+            if signature != self._loaded_signature:
+                self._loaded_rows = parse_cp_codes(_read_json(self.master_json_path))
+                self._loaded_signature = signature
+            self.cp_codes_data = [row.copy() for row in self._loaded_rows]
             
+            self._rebuild_index()
             self._refresh_tree()
         
         except Exception as e:
@@ -430,20 +611,12 @@ class ClientPositionPage:
     def _create_default_json_file(self):
         """Create master_passwords.json with default CP codes"""
         try:
-            with open(self.master_json_path, 'w') as f:
-                json.dump(self.DEFAULT_CP_CODES, f, indent=2)
+            _write_json(self.master_json_path, self._defaults())
             
             # Load the defaults into memory
-            self.cp_codes_data = []
-            for item in self.DEFAULT_CP_CODES:
-                self.cp_codes_data.append({
-                    'cp_code': item['cp_code'],
-                    'password': item['password'],
-                    'mode': item['mode'],
-                    'add_total': item['add_total'],
-                    'selected': False
-                })
+            self.cp_codes_data = self._default_rows()
             
+            self._rebuild_index()
             self._refresh_tree()
             # File created silently without showing message
         
@@ -456,7 +629,7 @@ class ClientPositionPage:
             "🔄 Confirm Reset to Default",
             f"This will:\n\n"
             f"• Delete all current CP codes\n"
-            f"• Restore {len(self.DEFAULT_CP_CODES)} default CP codes\n"
+            f"• Restore {self._DEFAULT_COUNT} default CP codes\n"
             f"• Overwrite {self.master_json_path}\n\n"
             f"⚠️ This action cannot be undone!\n\n"
             f"Do you want to continue?"
@@ -465,61 +638,132 @@ class ClientPositionPage:
         if result:
             try:
                 # Write defaults to JSON file
-                with open(self.master_json_path, 'w') as f:
-                    json.dump(self.DEFAULT_CP_CODES, f, indent=2)
+                self._wait_for_pending_save(flush=False)
+                _write_json(self.master_json_path, self._defaults())
                 
                 # Load defaults into memory
-                self.cp_codes_data = []
-                for item in self.DEFAULT_CP_CODES:
-                    self.cp_codes_data.append({
-                        'cp_code': item['cp_code'],
-                        'password': item['password'],
-                        'mode': item['mode'],
-                        'add_total': item['add_total'],
-                        'selected': False
-                    })
+                self.cp_codes_data = self._default_rows()
                 
+                self._rebuild_index()
                 self._refresh_tree()
                 messagebox.showinfo("✅ Reset Complete", 
-                    f"Successfully reset to {len(self.DEFAULT_CP_CODES)} default CP codes!")
+                    f"Successfully reset to {self._DEFAULT_COUNT} default CP codes!")
             
             except Exception as e:
                 messagebox.showerror("❌ Error", f"Failed to reset to defaults:\n{str(e)}")
     
-    def _auto_save_to_json(self):
-        """Auto-save current CP codes data to JSON file (silent)"""
+    def _persisted_rows(self):
+        """CP code rows in the on-disk array format (UI-only 'selected' dropped)"""
+        return [item.to_json() for item in self.cp_codes_data]
+    
+    def _show_status(self, text):
+        """Show a one-line outcome message next to the selection count"""
+        self.status_label.config(text=text)
+    
+    def _auto_save_to_json(self, status=None):
+        """
+        Auto-save current CP codes data to JSON file (silent, debounced, in
+        the background). status is shown right away and again, with the
+        file name, once the save has been written.
+        """
+        if status is not None:
+            self._save_status = status
+            self._show_status(status)
+        # Edits in quick succession end up in one write
+        self._save_dirty = True
+        if self._save_after_id is not None:
+            self.frame.after_cancel(self._save_after_id)
+        self._save_after_id = self.frame.after(500, self._flush_auto_save)
+    
+    def _flush_auto_save(self):
+        """Hand the current rows to the save worker if an auto-save is due"""
+        if self._save_after_id is not None:
+            self.frame.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if not self._save_dirty:
+            return
+        self._save_dirty = False
+        status, self._save_status = self._save_status, None
+        
+        # This snapshot is what the worker writes
+        data = self._persisted_rows()
+        
+        # A save that has not started yet is superseded by this newer snapshot
+        if self._save_future is not None:
+            self._save_future.cancel()
+        self._save_future = self._save_executor.submit(self._do_save, self.master_json_path, data, status)
+        if self._save_poll_id is None:
+            self._save_poll_id = self.frame.after(100, self._poll_save_outcomes)
+    
+    def _do_save(self, path, data, status=None):
+        """
+        Worker-thread body of _auto_save_to_json. Must not call Tk: the Tk
+        thread may be blocked in _wait_for_pending_save on this very save.
+        """
         try:
-            # Convert to array format
-            data = []
-            for item in self.cp_codes_data:
-                data.append({
-                    'cp_code': item['cp_code'],
-                    'password': item['password'],
-                    'mode': item['mode'],
-                    'add_total': item['add_total']
-                })
-            
-            with open(self.master_json_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        
+            _write_json(path, data)
         except Exception as e:
-            messagebox.showerror("❌ Error", f"Failed to auto-save CP codes:\n{str(e)}")
+            self._save_outcomes.put((path, None, e))
+            return
+        if status is not None:
+            self._save_outcomes.put((path, status, None))
+    
+    def _report_save_outcomes(self):
+        """Show the outcomes the save worker has posted so far (Tk thread)"""
+        while True:
+            try:
+                path, status, error = self._save_outcomes.get_nowait()
+            except queue.Empty:
+                return
+            if error is not None:
+                messagebox.showerror("❌ Error", f"Failed to auto-save CP codes:\n{str(error)}")
+            else:
+                self._show_status(f"{status} · saved to {path}")
+    
+    def _poll_save_outcomes(self):
+        """Report finished auto-saves; keep polling while one is outstanding"""
+        self._save_poll_id = None
+        # Checked before draining: a finished save has already posted its outcome
+        done = self._save_future is None or self._save_future.done()
+        self._report_save_outcomes()
+        if not done:
+            self._save_poll_id = self.frame.after(100, self._poll_save_outcomes)
+    
+    def _wait_for_pending_save(self, flush=True):
+        """
+        Block until a queued auto-save has hit the disk. With flush=False a
+        not-yet-started debounced save is dropped instead - for callers that
+        are about to overwrite the file themselves.
+        """
+        if flush:
+            self._flush_auto_save()
+        else:
+            if self._save_after_id is not None:
+                self.frame.after_cancel(self._save_after_id)
+                self._save_after_id = None
+            self._save_dirty = False
+            self._save_status = None
+        if self._save_future is not None:
+            if not self._save_future.cancelled():
+                self._save_future.result()
+            self._save_future = None
+        self._report_save_outcomes()
+    
+    def flush_pending_save(self):
+        """
+        Write any debounced auto-save now and wait for it. Call this before
+        anything outside the page reads or rewrites master_passwords.json.
+        """
+        self._wait_for_pending_save()
     
     def save_to_json(self):
         """Manually save current CP codes data to JSON file"""
         try:
-            # Convert to array format
-            data = []
-            for item in self.cp_codes_data:
-                data.append({
-                    'cp_code': item['cp_code'],
-                    'password': item['password'],
-                    'mode': item['mode'],
-                    'add_total': item['add_total']
-                })
+            self._wait_for_pending_save(flush=False)
             
-            with open(self.master_json_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = self._persisted_rows()
+            
+            _write_json(self.master_json_path, data)
             
             messagebox.showinfo("✅ Success", 
                 f"Successfully saved {len(data)} CP codes to\n{self.master_json_path}")
@@ -527,92 +771,159 @@ class ClientPositionPage:
         except Exception as e:
             messagebox.showerror("❌ Error", f"Failed to save CP codes:\n{str(e)}")
     
-    def add_cp_code(self):
-        """Add new CP code"""
+    def _cp_code_dialog(self):
+        """
+        The add/edit CP code dialog. It is built on first use and then
+        withdrawn/deiconified instead of being recreated for every action.
+        """
+        form = self._cp_form
+        if form is not None and form['dialog'].winfo_exists():
+            return form
+        
         dialog = tk.Toplevel(self.frame)
-        dialog.title("➕ Add New CP Code")
         dialog.geometry("450x280")
         dialog.resizable(False, False)
         dialog.configure(bg='#f0f8f0')
         
         # Center the dialog
         dialog.transient(self.frame)
-        dialog.grab_set()
         
-        # Form fields
-        tk.Label(dialog, text="CP Code:", font=('Arial', 10, 'bold'), 
+        # Form fields - row 0 shows an entry when adding, a read-only label when editing
+        tk.Label(dialog, text="CP Code:", font=_FONT_10_BOLD, 
                 bg='#f0f8f0').grid(row=0, column=0, sticky='w', padx=20, pady=12)
-        cp_code_entry = tk.Entry(dialog, font=('Arial', 10), width=35)
+        cp_code_entry = tk.Entry(dialog, font=_FONT_10, width=35)
         cp_code_entry.grid(row=0, column=1, padx=20, pady=12)
-        cp_code_entry.focus()
+        cp_code_label = tk.Label(dialog, font=_FONT_10, 
+                                 bg='#e8f5e9', relief=tk.SUNKEN, width=33, anchor='w', padx=5)
+        cp_code_label.grid(row=0, column=1, padx=20, pady=12)
         
-        tk.Label(dialog, text="Password:", font=('Arial', 10, 'bold'), 
+        tk.Label(dialog, text="Password:", font=_FONT_10_BOLD, 
                 bg='#f0f8f0').grid(row=1, column=0, sticky='w', padx=20, pady=12)
-        password_entry = tk.Entry(dialog, font=('Arial', 10), width=35)
-        password_entry.insert(0, "123")
+        password_entry = tk.Entry(dialog, font=_FONT_10, width=35)
         password_entry.grid(row=1, column=1, padx=20, pady=12)
         
-        tk.Label(dialog, text="Mode:", font=('Arial', 10, 'bold'), 
+        tk.Label(dialog, text="Mode:", font=_FONT_10_BOLD, 
                 bg='#f0f8f0').grid(row=2, column=0, sticky='w', padx=20, pady=12)
         mode_var = tk.StringVar(value="7z")
         mode_frame = tk.Frame(dialog, bg='#f0f8f0')
         mode_frame.grid(row=2, column=1, sticky='w', padx=20, pady=12)
         tk.Radiobutton(mode_frame, text="ZIP", variable=mode_var, value="zip", 
-                      bg='#f0f8f0', font=('Arial', 10)).pack(side=tk.LEFT, padx=10)
+                      bg='#f0f8f0', font=_FONT_10).pack(side=tk.LEFT, padx=10)
         tk.Radiobutton(mode_frame, text="7z", variable=mode_var, value="7z", 
-                      bg='#f0f8f0', font=('Arial', 10)).pack(side=tk.LEFT, padx=10)
+                      bg='#f0f8f0', font=_FONT_10).pack(side=tk.LEFT, padx=10)
         
-        tk.Label(dialog, text="Add Total Row:", font=('Arial', 10, 'bold'), 
+        tk.Label(dialog, text="Add Total Row:", font=_FONT_10_BOLD, 
                 bg='#f0f8f0').grid(row=3, column=0, sticky='w', padx=20, pady=12)
         add_total_var = tk.BooleanVar(value=False)
         tk.Checkbutton(dialog, text="Yes, add total row", variable=add_total_var, 
-                      bg='#f0f8f0', font=('Arial', 10)).grid(row=3, column=1, 
+                      bg='#f0f8f0', font=_FONT_10).grid(row=3, column=1, 
                       sticky='w', padx=20, pady=12)
         
-        # Buttons
+        # Buttons - the save action is swapped in each time the dialog opens
         btn_frame = tk.Frame(dialog, bg='#f0f8f0')
         btn_frame.grid(row=4, column=0, columnspan=2, pady=20)
         
+        save_btn = tk.Button(btn_frame, command=lambda: form['on_save'](),
+                             fg='white', font=_FONT_10_BOLD, 
+                             relief=tk.FLAT, padx=25, pady=8)
+        save_btn.pack(side=tk.LEFT, padx=5)
+        
+        def cancel():
+            self._refresh_tree_and_focus(reset_filter=True, deselect_all=True)
+            self._hide_dialog(dialog)
+        
+        tk.Button(btn_frame, text="✖ Cancel", command=cancel,
+                 bg='#95a5a6', fg='white', font=_FONT_10, 
+                 relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=5)
+        
+        # Closing the window only hides it, so it can be shown again
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
+        
+        form = self._cp_form = {
+            'dialog': dialog,
+            'cp_code_entry': cp_code_entry,
+            'cp_code_label': cp_code_label,
+            'password_entry': password_entry,
+            'mode_var': mode_var,
+            'add_total_var': add_total_var,
+            'save_btn': save_btn,
+            'on_save': None,
+        }
+        return form
+    
+    def _show_dialog(self, dialog, title):
+        """Bring a reused dialog back on screen as a modal window"""
+        dialog.title(title)
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+    
+    def _hide_dialog(self, dialog):
+        """Put a reused dialog away without destroying it"""
+        dialog.grab_release()
+        dialog.withdraw()
+    
+    def _open_cp_code_dialog(self, title, cp_data, save_text, save_color, on_save):
+        """Fill the add/edit dialog for cp_data (None when adding) and show it"""
+        form = self._cp_code_dialog()
+        form['on_save'] = on_save
+        form['save_btn'].configure(text=save_text, bg=save_color)
+        
+        password_entry = form['password_entry']
+        password_entry.delete(0, tk.END)
+        if cp_data is None:
+            form['cp_code_label'].grid_remove()
+            form['cp_code_entry'].grid()
+            form['cp_code_entry'].delete(0, tk.END)
+            password_entry.insert(0, "123")
+            form['mode_var'].set("7z")
+            form['add_total_var'].set(False)
+            focus = form['cp_code_entry']
+        else:
+            form['cp_code_entry'].grid_remove()
+            form['cp_code_label'].configure(text=cp_data.cp_code)
+            form['cp_code_label'].grid()
+            password_entry.insert(0, cp_data.password)
+            form['mode_var'].set(cp_data.mode)
+            form['add_total_var'].set(cp_data.add_total)
+            focus = password_entry
+        
+        self._show_dialog(form['dialog'], title)
+        focus.focus()
+        return form
+    
+    def add_cp_code(self):
+        """Add new CP code"""
         def save_new():
-            cp_code = cp_code_entry.get().strip()
+            dialog = form['dialog']
+            cp_code = form['cp_code_entry'].get().strip()
             if not cp_code:
                 messagebox.showwarning("⚠️ Validation Error", "CP Code cannot be empty!", parent=dialog)
                 return
             
             # Check if CP code already exists
-            if any(item['cp_code'] == cp_code for item in self.cp_codes_data):
+            if cp_code in self._cp_index:
                 messagebox.showwarning("⚠️ Duplicate", 
                     f"CP Code '{cp_code}' already exists!", parent=dialog)
                 return
             
-            self.cp_codes_data.append({
-                'cp_code': cp_code,
-                'password': password_entry.get().strip() or '123',
-                'mode': mode_var.get(),
-                'add_total': add_total_var.get(),
-                'selected': False
-            })
+            new_row = CPRow(
+                cp_code,
+                form['password_entry'].get().strip() or '123',
+                form['mode_var'].get(),
+                form['add_total_var'].get()
+            )
+            self.cp_codes_data.append(new_row)
+            self._cp_index[cp_code] = new_row
+            self._data_version += 1
             
             self._refresh_tree_and_focus(cp_code, reset_filter=True, deselect_all=True)
-            dialog.destroy()
+            self._hide_dialog(dialog)
             
             # Auto-save to JSON file
-            self._auto_save_to_json()
-            
-            messagebox.showinfo("✅ Success", 
-                f"Added CP Code: {cp_code}\n\nAutomatically saved to {self.master_json_path}")
+            self._auto_save_to_json(f"✅ Added CP Code: {cp_code}")
         
-        tk.Button(btn_frame, text="💾 Save", command=save_new,
-                 bg='#27ae60', fg='white', font=('Arial', 10, 'bold'), 
-                 relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=5)
-        
-        def cancel_add():
-            self._refresh_tree_and_focus(reset_filter=True, deselect_all=True)
-            dialog.destroy()
-        
-        tk.Button(btn_frame, text="✖ Cancel", command=cancel_add,
-                 bg='#95a5a6', fg='white', font=('Arial', 10), 
-                 relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=5)
+        form = self._open_cp_code_dialog("➕ Add New CP Code", None, "💾 Save", '#27ae60', save_new)
     
     def edit_cp_code(self, event=None):
         """Edit selected CP code"""
@@ -621,95 +932,33 @@ class ClientPositionPage:
             messagebox.showwarning("⚠️ No Selection", "Please select a CP code to edit.")
             return
         
-        item = self.tree.item(selection[0])
-        values = item['values']
-        cp_code = values[1]
-        
-        # Find the CP code data - ensure both are strings for comparison
-        cp_code_str = str(cp_code) if cp_code is not None else ''
-        cp_data = next((item for item in self.cp_codes_data if str(item['cp_code']) == cp_code_str), None)
-        if not cp_data:
-            # Debug: Show available CP codes and types
-            available_codes = [item['cp_code'] for item in self.cp_codes_data]
-            cp_code_type = type(cp_code).__name__
-            available_types = [type(item['cp_code']).__name__ for item in self.cp_codes_data[:5]]
-            
+        # The tree item maps straight to its row (its values may come back as ints)
+        cp_data = self._row_by_iid.get(selection[0])
+        if cp_data is None:
+            # Debug: show what the tree item held; only a handful of codes are listed
+            cp_code = self.tree.item(selection[0], 'values')[1]
+            available_codes = [row.cp_code for row in islice(self.cp_codes_data, 10)]
             messagebox.showerror("❌ Error", 
-                f"CP code '{cp_code}' (type: {cp_code_type}) not found in data.\n\n"
-                f"Looking for: '{cp_code}'\n"
-                f"Available CP codes: {', '.join(available_codes[:10])}{'...' if len(available_codes) > 10 else ''}\n"
-                f"Data types: {', '.join(available_types)}")
+                f"CP code '{cp_code}' (type: {type(cp_code).__name__}) not found in data.\n\n"
+                f"Available CP codes: {', '.join(available_codes)}"
+                f"{'...' if len(self.cp_codes_data) > 10 else ''}")
             return
-        
-        dialog = tk.Toplevel(self.frame)
-        dialog.title(f"✏️ Edit CP Code: {cp_code}")
-        dialog.geometry("450x280")
-        dialog.resizable(False, False)
-        dialog.configure(bg='#f0f8f0')
-        
-        dialog.transient(self.frame)
-        dialog.grab_set()
-        
-        # Form fields (CP Code is read-only)
-        tk.Label(dialog, text="CP Code:", font=('Arial', 10, 'bold'), 
-                bg='#f0f8f0').grid(row=0, column=0, sticky='w', padx=20, pady=12)
-        cp_code_label = tk.Label(dialog, text=cp_code, font=('Arial', 10), 
-                                 bg='#e8f5e9', relief=tk.SUNKEN, width=33, anchor='w', padx=5)
-        cp_code_label.grid(row=0, column=1, padx=20, pady=12)
-        
-        tk.Label(dialog, text="Password:", font=('Arial', 10, 'bold'), 
-                bg='#f0f8f0').grid(row=1, column=0, sticky='w', padx=20, pady=12)
-        password_entry = tk.Entry(dialog, font=('Arial', 10), width=35)
-        password_entry.insert(0, cp_data['password'])
-        password_entry.grid(row=1, column=1, padx=20, pady=12)
-        password_entry.focus()
-        
-        tk.Label(dialog, text="Mode:", font=('Arial', 10, 'bold'), 
-                bg='#f0f8f0').grid(row=2, column=0, sticky='w', padx=20, pady=12)
-        mode_var = tk.StringVar(value=cp_data['mode'])
-        mode_frame = tk.Frame(dialog, bg='#f0f8f0')
-        mode_frame.grid(row=2, column=1, sticky='w', padx=20, pady=12)
-        tk.Radiobutton(mode_frame, text="ZIP", variable=mode_var, value="zip", 
-                      bg='#f0f8f0', font=('Arial', 10)).pack(side=tk.LEFT, padx=10)
-        tk.Radiobutton(mode_frame, text="7z", variable=mode_var, value="7z", 
-                      bg='#f0f8f0', font=('Arial', 10)).pack(side=tk.LEFT, padx=10)
-        
-        tk.Label(dialog, text="Add Total Row:", font=('Arial', 10, 'bold'), 
-                bg='#f0f8f0').grid(row=3, column=0, sticky='w', padx=20, pady=12)
-        add_total_var = tk.BooleanVar(value=cp_data['add_total'])
-        tk.Checkbutton(dialog, text="Yes, add total row", variable=add_total_var, 
-                      bg='#f0f8f0', font=('Arial', 10)).grid(row=3, column=1, 
-                      sticky='w', padx=20, pady=12)
-        
-        # Buttons
-        btn_frame = tk.Frame(dialog, bg='#f0f8f0')
-        btn_frame.grid(row=4, column=0, columnspan=2, pady=20)
+        cp_code = cp_data.cp_code
         
         def save_changes():
-            cp_data['password'] = password_entry.get().strip() or '123'
-            cp_data['mode'] = mode_var.get()
-            cp_data['add_total'] = add_total_var.get()
+            cp_data.password = form['password_entry'].get().strip() or '123'
+            cp_data.mode = form['mode_var'].get()
+            cp_data.add_total = form['add_total_var'].get()
+            self._data_version += 1
             
             self._refresh_tree_and_focus(cp_code, reset_filter=True, deselect_all=True)
-            dialog.destroy()
+            self._hide_dialog(form['dialog'])
             
             # Auto-save to JSON file
-            self._auto_save_to_json()
-            
-            messagebox.showinfo("✅ Success", 
-                f"Updated CP Code: {cp_code}\n\nAutomatically saved to {self.master_json_path}")
+            self._auto_save_to_json(f"✅ Updated CP Code: {cp_code}")
         
-        tk.Button(btn_frame, text="💾 Update", command=save_changes,
-                 bg='#f39c12', fg='white', font=('Arial', 10, 'bold'), 
-                 relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=5)
-        
-        def cancel_edit():
-            self._refresh_tree_and_focus(reset_filter=True, deselect_all=True)
-            dialog.destroy()
-        
-        tk.Button(btn_frame, text="✖ Cancel", command=cancel_edit,
-                 bg='#95a5a6', fg='white', font=('Arial', 10), 
-                 relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=5)
+        form = self._open_cp_code_dialog(f"✏️ Edit CP Code: {cp_code}", cp_data,
+                                         "💾 Update", '#f39c12', save_changes)
     
     def delete_cp_code(self):
         """Delete selected CP code"""
@@ -718,22 +967,26 @@ class ClientPositionPage:
             messagebox.showwarning("⚠️ No Selection", "Please select a CP code to delete.")
             return
         
-        item = self.tree.item(selection[0])
-        cp_code = item['values'][1]
+        # Resolve the row from the tree item itself: Tk hands numeric-looking
+        # CP codes back as ints, which never compared equal to the stored str
+        row = self._row_by_iid.get(selection[0])
+        if row is None:
+            return
+        cp_code = row.cp_code
         
         result = messagebox.askyesno("🗑️ Confirm Delete", 
                                      f"Are you sure you want to delete?\n\nCP Code: {cp_code}")
         
         if result:
-            self.cp_codes_data = [item for item in self.cp_codes_data 
-                                 if item['cp_code'] != cp_code]
+            self.cp_codes_data.remove(row)
+            self._selected_count -= row.selected
+            if self._cp_index.get(cp_code) is row:
+                del self._cp_index[cp_code]
+            self._data_version += 1
             self._refresh_tree()
             
             # Auto-save to JSON file
-            self._auto_save_to_json()
-            
-            messagebox.showinfo("✅ Success", 
-                f"Deleted CP Code: {cp_code}\n\nAutomatically saved to {self.master_json_path}")
+            self._auto_save_to_json(f"✅ Deleted CP Code: {cp_code}")
     
     def delete_all_cp_codes(self):
         """Delete every CP code after confirmation."""
@@ -750,66 +1003,178 @@ class ClientPositionPage:
             return
 
         self.cp_codes_data = []
+        self._rebuild_index()
         self._refresh_tree()
 
         try:
-            with open(self.master_json_path, 'w') as f:
-                json.dump([], f, indent=2)
+            self._wait_for_pending_save(flush=False)
+            _write_json(self.master_json_path, [])
         except Exception as exc:
             messagebox.showerror("❌ Error", f"Failed to clear CP codes:\n{exc}")
             return
 
         messagebox.showinfo("✅ Success", f"All CP codes deleted from {self.master_json_path}.")
     
+    def _rebuild_index(self):
+        """Rebuild the cp_code → row lookup and selection count after cp_codes_data is replaced"""
+        # Iterate in reverse so the first row wins if a CP code is duplicated
+        self._cp_index = {row.cp_code: row for row in reversed(self.cp_codes_data)}
+        self._selected_count = sum(row.selected for row in self.cp_codes_data)
+        self._data_version += 1
+    
+    def _row_display(self, data):
+        """Tree values and tags for one CP code row"""
+        checkbox = '☑' if data.selected else '☐'
+        add_total_text = '✓' if data.add_total else '✗'
+        values = (
+            checkbox, 
+            data.cp_code, 
+            data.password,
+            data.mode.upper(),
+            add_total_text
+        )
+        return values, ('selected' if data.selected else 'unselected',)
+    
+    def _rebuild_tree(self):
+        """
+        Bring the tree items in line with cp_codes_data. Items are matched
+        to rows by CP code: unchanged rows are left alone, changed rows are
+        redrawn in place, and only added/removed CP codes insert/delete items.
+        New rows only get an iid here; their Tk item is created by
+        _show_iids the first time the filter attaches them.
+        """
+        # CP code -> existing iids (a list, in case a code is duplicated)
+        reusable = {}
+        for iid, data in self._tree_items:
+            reusable.setdefault(data.cp_code, []).append(iid)
+        # Search keys are only recomputed for new or edited rows
+        old_keys = {iid: key for (iid, _), key in zip(self._tree_items, self._search_keys)}
+        
+        displayed = {}
+        self._tree_items = []
+        self._iid_by_cp = {}
+        self._search_keys = []
+        for data in self.cp_codes_data:
+            shown = self._row_display(data)
+            iids = reusable.get(data.cp_code)
+            key = None
+            if iids:
+                iid = iids.pop(0)
+                old_shown = self._displayed.get(iid)
+                if old_shown != shown and iid in self._created_iids:
+                    self.tree.item(iid, values=shown[0], tags=shown[1])
+                # values[1:3] are the cp_code and password the key was made from
+                if old_shown is not None and old_shown[0][1:3] == shown[0][1:3]:
+                    key = old_keys.get(iid)
+            else:
+                iid = f"cp{next(self._iid_counter)}"
+            displayed[iid] = shown
+            self._tree_items.append((iid, data))
+            if key is None:
+                key = search_key(data.cp_code, data.password)
+            self._search_keys.append(key)
+            self._iid_by_cp.setdefault(data.cp_code, iid)
+        
+        # Drop items for CP codes that are gone, in one Tk call
+        stale = [iid for iids in reusable.values() for iid in iids
+                 if iid in self._created_iids]
+        if stale:
+            self.tree.delete(*stale)
+            self._created_iids.difference_update(stale)
+        self._displayed = displayed
+        self._row_by_iid = dict(self._tree_items)
+    
+    def _apply_filter(self, filter_text):
+        """Show only rows matching filter_text by detaching/reattaching existing items"""
+        matches = filter_cp_codes(self._search_keys, filter_text)
+        matching = [iid for i, (iid, _) in enumerate(self._tree_items) if i in matches]
+        # Large lists are shown a page at a time; the rest attach on scroll
+        attached = matching[:self._TREE_PAGE_SIZE]
+        self._show_iids(attached)
+        # One call replaces the visible rows; everything else is detached, not deleted
+        self.tree.set_children('', *attached)
+        self._attached_iids = set(attached)
+        self._unattached_matches = matching[self._TREE_PAGE_SIZE:]
+    
+    def _show_iids(self, iids):
+        """Create the Tk items for any of iids that have not been shown yet"""
+        created = self._created_iids
+        for iid in iids:
+            if iid not in created:
+                values, tags = self._displayed[iid]
+                # Insert at the head: Tk walks the whole sibling list to find
+                # 'end', while index 0 is constant time. The caller's
+                # set_children puts the rows in order right after.
+                self.tree.insert('', 0, iid=iid, values=values, tags=tags)
+                created.add(iid)
+    
+    def _attach_next_page(self):
+        """Attach the next page of matching rows below the ones already shown"""
+        page = self._unattached_matches[:self._TREE_PAGE_SIZE]
+        del self._unattached_matches[:self._TREE_PAGE_SIZE]
+        # Read the shown rows first: creating an item also attaches it
+        shown = self.tree.get_children()
+        self._show_iids(page)
+        self.tree.set_children('', *shown, *page)
+        self._attached_iids.update(page)
+    
+    def _on_tree_yscroll(self, first, last):
+        """Keep the scrollbar in sync and attach more rows near the bottom"""
+        self._tree_vsb.set(first, last)
+        if self._unattached_matches and float(last) >= 0.9:
+            self._attach_next_page()
+    
+    def _update_tree_row(self, data, iid=None):
+        """Redraw a single CP code row in place"""
+        if iid is None:
+            iid = self._iid_by_cp.get(data.cp_code)
+        if iid is not None:
+            shown = self._row_display(data)
+            if iid in self._created_iids:
+                self.tree.item(iid, values=shown[0], tags=shown[1])
+            self._displayed[iid] = shown
+    
+    def _update_selection_label(self):
+        """Update selection count"""
+        total_count = len(self.cp_codes_data)
+        self.selection_label.config(text=f"Selected: {self._selected_count} / {total_count}")
+    
     def _refresh_tree(self, filter_text=None):
         """Refresh the tree view with current data"""
         if filter_text is None:
             filter_text = self.search_var.get()
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # A debounced search for the same text would only repeat this refresh
+        if filter_text == self.search_var.get():
+            self._cancel_pending_search()
         
-        # Filter data if search text provided
-        if filter_text:
-            filtered_data = [d for d in self.cp_codes_data 
-                           if filter_text.lower() in d['cp_code'].lower() or
-                              filter_text.lower() in d['password'].lower()]
-        else:
-            filtered_data = self.cp_codes_data
+        # Nothing changed since the last refresh - the tree is already current
+        state = (filter_text, self._data_version)
+        if state == self._tree_state:
+            return
         
-        # Add items to tree
-        for data in filtered_data:
-            checkbox = '☑' if data['selected'] else '☐'
-            add_total_text = '✓' if data['add_total'] else '✗'
-            
-            self.tree.insert('', tk.END, values=(
-                checkbox, 
-                data['cp_code'], 
-                data['password'],
-                data['mode'].upper(),
-                add_total_text
-            ), tags=('selected' if data['selected'] else 'unselected',))
-        
-        # Configure tags for visual feedback
-        self.tree.tag_configure('selected', background='#e8f5e9', font=('Arial', 9, 'bold'))
-        self.tree.tag_configure('unselected', background='white', font=('Arial', 9))
-        
-        # Update selection count
-        selected_count = sum(1 for d in self.cp_codes_data if d['selected'])
-        total_count = len(self.cp_codes_data)
-        self.selection_label.config(text=f"Selected: {selected_count} / {total_count}")
+        self._rebuild_tree()
+        self._apply_filter(filter_text)
+        self._update_selection_label()
+        self._tree_state = state
     
     def _refresh_tree_and_focus(self, cp_code=None, reset_filter=False, deselect_all=False):
         """Refresh tree with options to reset filter, focus a CP code, and clear selections."""
 
-        if deselect_all:
+        if deselect_all and self._selected_count:
             for data in self.cp_codes_data:
-                data['selected'] = False
+                data.selected = False
+            self._selected_count = 0
+            self._data_version += 1
 
         if reset_filter:
-            self.search_var.set('')
-            # Ensure table refreshes immediately even if trace callbacks are delayed
+            # Clear the search box without the trace queueing a search of its own;
+            # the refresh below already applies the empty filter
+            self._suspend_search_trace = True
+            try:
+                self.search_var.set('')
+            finally:
+                self._suspend_search_trace = False
             self._refresh_tree('')
         else:
             self._refresh_tree(self.search_var.get())
@@ -817,20 +1182,19 @@ class ClientPositionPage:
                 self._focus_tree_item(cp_code)
             return
 
-        # When reset_filter=True, the trace callback already refreshed the tree.
+        # When reset_filter=True, the tree was refreshed above with the cleared filter.
         if cp_code is not None and not deselect_all:
             self._focus_tree_item(cp_code)
     
     def _focus_tree_item(self, cp_code):
         """Ensure the specified CP code row remains focused after refresh"""
-        cp_code_str = str(cp_code) if cp_code is not None else ''
-        for item in self.tree.get_children():
-            values = self.tree.item(item, 'values')
-            if values and str(values[1]) == cp_code_str:
-                self.tree.selection_set(item)
-                self.tree.focus(item)
-                self.tree.see(item)
-                break
+        item = self._iid_by_cp.get(cp_code)
+        while item not in self._attached_iids and item in self._unattached_matches:
+            self._attach_next_page()
+        if item in self._attached_iids:
+            self.tree.selection_set(item)
+            self.tree.focus(item)
+            self.tree.see(item)
     
     def _on_tree_click(self, event):
         """Handle tree click to toggle checkbox"""
@@ -848,73 +1212,86 @@ class ClientPositionPage:
             column = self.tree.identify_column(event.x)
             
             if item:
-                values = self.tree.item(item, 'values')
-                cp_code = values[1]
-                
                 # Toggle if clicking on select column or CP code column
                 if column in ('#1', '#2'):  # Select column or CP Code column
-                    cp_code_str = str(cp_code) if cp_code is not None else ''
-                    for data in self.cp_codes_data:
-                        if str(data['cp_code']) == cp_code_str:
-                            data['selected'] = not data['selected']
-                            break
-                    
-                    self._refresh_tree(self.search_var.get())
-                    self._focus_tree_item(cp_code_str)
+                    # Go from the item to its row rather than through the shown
+                    # values, which Tk hands back as ints for numeric-looking codes
+                    data = self._row_by_iid.get(item)
+                    if data is not None:
+                        data.selected = not data.selected
+                        self._selected_count += 1 if data.selected else -1
+                        self._update_tree_row(data, item)
+                        self._update_selection_label()
+                        self._focus_tree_item(data.cp_code)
     
     def _on_search(self, *args):
-        """Handle search text change"""
-        search_text = self.search_var.get()
-        self._refresh_tree(search_text)
-    
-    def bulk_update_all(self):
-        """Bulk update mode and total settings for every CP code"""
-        if not self.cp_codes_data:
-            messagebox.showinfo("ℹ️ No Records", "There are no CP codes available to update.")
+        """Handle search text change - filter once typing pauses"""
+        if self._suspend_search_trace:
             return
+        self._cancel_pending_search()
+        self._search_after_id = self.frame.after(150, self._do_search)
+    
+    def _cancel_pending_search(self):
+        """Drop a scheduled _do_search, if any"""
+        if self._search_after_id is not None:
+            self.frame.after_cancel(self._search_after_id)
+            self._search_after_id = None
+    
+    def _do_search(self):
+        """Apply the current search text to the tree"""
+        self._search_after_id = None
+        filter_text = self.search_var.get()
+        self._apply_filter(filter_text)
+        self._tree_state = (filter_text, self._data_version)
+    
+    def _bulk_update_dialog(self):
+        """
+        The bulk update dialog, built on first use and reused afterwards
+        (see _cp_code_dialog).
+        """
+        form = self._bulk_form
+        if form is not None and form['dialog'].winfo_exists():
+            return form
         
         dialog = tk.Toplevel(self.frame)
-        dialog.title("⚙ Update Mode / Total For All")
         dialog.geometry("360x220")
         dialog.resizable(False, False)
         dialog.configure(bg='#fdf7f0')
         
         dialog.transient(self.frame)
-        dialog.grab_set()
         
         # Mode selection controls
         apply_mode_var = tk.BooleanVar(value=True)
         tk.Checkbutton(dialog, text="Update Mode", variable=apply_mode_var,
-                       bg='#fdf7f0', font=('Arial', 10, 'bold')).grid(row=0, column=0, columnspan=2,
+                       bg='#fdf7f0', font=_FONT_10_BOLD).grid(row=0, column=0, columnspan=2,
                                                                        sticky='w', padx=20, pady=(20, 6))
         
-        tk.Label(dialog, text="Mode:", font=('Arial', 10),
+        tk.Label(dialog, text="Mode:", font=_FONT_10,
                  bg='#fdf7f0').grid(row=1, column=0, sticky='w', padx=20, pady=4)
         
-        first_mode = (self.cp_codes_data[0].get('mode') or '7z').lower()
-        mode_var = tk.StringVar(value='zip' if first_mode == 'zip' else '7z')
+        mode_var = tk.StringVar(value='7z')
         
         mode_frame = tk.Frame(dialog, bg='#fdf7f0')
         mode_frame.grid(row=1, column=1, sticky='w', padx=20, pady=4)
         mode_zip_btn = tk.Radiobutton(mode_frame, text="ZIP", variable=mode_var, value="zip",
-                                      bg='#fdf7f0', font=('Arial', 10))
+                                      bg='#fdf7f0', font=_FONT_10)
         mode_zip_btn.pack(side=tk.LEFT, padx=5)
         mode_7z_btn = tk.Radiobutton(mode_frame, text="7z", variable=mode_var, value="7z",
-                                     bg='#fdf7f0', font=('Arial', 10))
+                                     bg='#fdf7f0', font=_FONT_10)
         mode_7z_btn.pack(side=tk.LEFT, padx=5)
         
         # Total row controls
         apply_total_var = tk.BooleanVar(value=True)
         tk.Checkbutton(dialog, text="Update Total Setting", variable=apply_total_var,
-                       bg='#fdf7f0', font=('Arial', 10, 'bold')).grid(row=2, column=0, columnspan=2,
+                       bg='#fdf7f0', font=_FONT_10_BOLD).grid(row=2, column=0, columnspan=2,
                                                                        sticky='w', padx=20, pady=(12, 6))
         
-        tk.Label(dialog, text="Add Total Row:", font=('Arial', 10),
+        tk.Label(dialog, text="Add Total Row:", font=_FONT_10,
                  bg='#fdf7f0').grid(row=3, column=0, sticky='w', padx=20, pady=4)
         
-        add_total_var = tk.BooleanVar(value=bool(self.cp_codes_data[0].get('add_total')))
+        add_total_var = tk.BooleanVar(value=False)
         total_checkbox = tk.Checkbutton(dialog, text="Yes, include total row", variable=add_total_var,
-                                        bg='#fdf7f0', font=('Arial', 10))
+                                        bg='#fdf7f0', font=_FONT_10)
         total_checkbox.grid(row=3, column=1, sticky='w', padx=20, pady=4)
         
         # Buttons
@@ -932,7 +1309,8 @@ class ClientPositionPage:
         
         def apply_changes():
             if not apply_mode_var.get() and not apply_total_var.get():
-                messagebox.showwarning("⚠️ No Update Selected", "Enable Mode and/or Total before applying changes.")
+                messagebox.showwarning("⚠️ No Update Selected", "Enable Mode and/or Total before applying changes.",
+                                       parent=dialog)
                 return
             
             summary_parts = []
@@ -940,56 +1318,90 @@ class ClientPositionPage:
             if apply_mode_var.get():
                 new_mode = mode_var.get()
                 for data in self.cp_codes_data:
-                    data['mode'] = new_mode
+                    data.mode = new_mode
                 summary_parts.append(f"mode '{new_mode.upper()}'")
             
             if apply_total_var.get():
                 new_total = add_total_var.get()
                 for data in self.cp_codes_data:
-                    data['add_total'] = new_total
+                    data.add_total = new_total
                 summary_parts.append(f"total row {'ON' if new_total else 'OFF'}")
             
-            self._refresh_tree(self.search_var.get())
-            dialog.destroy()
+            for iid, data in self._tree_items:
+                self._update_tree_row(data, iid)
+            self._hide_dialog(dialog)
             
             # Auto-save to JSON file
-            self._auto_save_to_json()
-            
-            messagebox.showinfo("✅ Update Complete",
-                                f"Updated all {len(self.cp_codes_data)} CP code(s) → {', '.join(summary_parts)}.")
+            self._auto_save_to_json(
+                f"✅ Updated all {len(self.cp_codes_data)} CP code(s) → {', '.join(summary_parts)}")
         
-        # Initialize states
+        # Initialize states; the traces keep them in sync on every reuse
         toggle_mode_state()
         toggle_total_state()
         apply_mode_var.trace_add('write', lambda *_: toggle_mode_state())
         apply_total_var.trace_add('write', lambda *_: toggle_total_state())
         
-        def cancel_changes():
-            dialog.destroy()
-        
         tk.Button(btn_frame, text="💾 Apply", command=apply_changes,
-                 bg='#27ae60', fg='white', font=('Arial', 10, 'bold'),
+                 bg='#27ae60', fg='white', font=_FONT_10_BOLD,
                  relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=8)
         
-        tk.Button(btn_frame, text="✖ Cancel", command=cancel_changes,
-                 bg='#95a5a6', fg='white', font=('Arial', 10),
+        tk.Button(btn_frame, text="✖ Cancel", command=lambda: self._hide_dialog(dialog),
+                 bg='#95a5a6', fg='white', font=_FONT_10,
                  relief=tk.FLAT, padx=25, pady=8).pack(side=tk.LEFT, padx=8)
         
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
+        
+        form = self._bulk_form = {
+            'dialog': dialog,
+            'apply_mode_var': apply_mode_var,
+            'apply_total_var': apply_total_var,
+            'mode_var': mode_var,
+            'add_total_var': add_total_var,
+        }
+        return form
+    
+    def bulk_update_all(self):
+        """Bulk update mode and total settings for every CP code"""
+        if not self.cp_codes_data:
+            messagebox.showinfo("ℹ️ No Records", "There are no CP codes available to update.")
+            return
+        
+        form = self._bulk_update_dialog()
+        
+        # Start from the first row's settings each time the dialog opens
+        first = self.cp_codes_data[0]
+        first_mode = (first.mode or '7z').lower()
+        form['mode_var'].set('zip' if first_mode == 'zip' else '7z')
+        form['add_total_var'].set(bool(first.add_total))
+        form['apply_mode_var'].set(True)
+        form['apply_total_var'].set(True)
+        
+        self._show_dialog(form['dialog'], "⚙ Update Mode / Total For All")
+        
     def _select_all(self):
         """Select all CP codes"""
-        for data in self.cp_codes_data:
-            data['selected'] = True
-        self._refresh_tree(self.search_var.get())
+        # Rows already in the target state keep their tree item as it is
+        for iid, data in self._tree_items:
+            if not data.selected:
+                data.selected = True
+                self._update_tree_row(data, iid)
+        self._selected_count = len(self._tree_items)
+        self._update_selection_label()
     
     def _deselect_all(self):
         """Deselect all CP codes"""
-        for data in self.cp_codes_data:
-            data['selected'] = False
-        self._refresh_tree(self.search_var.get())
+        if not self._selected_count:
+            return
+        for iid, data in self._tree_items:
+            if data.selected:
+                data.selected = False
+                self._update_tree_row(data, iid)
+        self._selected_count = 0
+        self._update_selection_label()
     
     def get_selected_cp_codes(self):
         """Get list of selected CP codes with their settings"""
-        return [d for d in self.cp_codes_data if d['selected']]
+        return [d for d in self.cp_codes_data if d.selected]
     
     def get_values(self):
         selected = self.get_selected_cp_codes()
@@ -997,11 +1409,11 @@ class ClientPositionPage:
             'client_position_path': self.client_position_path.get(),
             'output_path': self.output_path.get(),
             'cash_collateral_path': self.cash_collateral_path.get(),
-            'selected_cp_codes': [d['cp_code'] for d in selected],
-            'cp_codes_config': {d['cp_code']: {
-                'password': d['password'],
-                'mode': d['mode'],
-                'add_total': d['add_total']
+            'selected_cp_codes': [d.cp_code for d in selected],
+            'cp_codes_config': {d.cp_code: {
+                'password': d.password,
+                'mode': d.mode,
+                'add_total': d.add_total
             } for d in selected}
         }
 
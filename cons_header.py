@@ -64,29 +64,25 @@ RSVD4 = "Rsvd4"
 
 
 ########################### stamp duty header
+# Fields shared with the obligation header (Sgmt, Src, ClrMmbId, ...) are
+# defined once above; only the new ones are added here.
 RPTHDR = "RptHdr"
-SGMT = "Sgmt"
-SRC = "Src"
-STTLMTP = "SttlmTp"
-SCTIESSTTLMTXID = "SctiesSttlmTxId"
-CLRMMBID = "ClrMmbId"
-BRKRORCTDNPTCPTID = "BrkrOrCtdnPtcptId"
 CLCTNDT = "ClctnDt"
 DUEDT = "DueDt"
-CLNTID = "ClntId"
 CTRYSUBDVSN = "CtrySubDvsn"
-TCKRSYMB = "TckrSymb"
-SCTYSRS = "SctySrs"
-FININSTRMID = "FinInstrmId"
 FININSTRMTP = "FinInstrmTp"
-ISIN = "ISIN"
 XPRYDT = "XpryDt"
 STRKPRIC = "StrkPric"
 OPTNTP = "OptnTp"
-TTLBUTRADGVOL = "TtlBuyTradgVol"
-TTLBUTRFVAL = "TtlBuyTrfVal"
-TTLSLLTRADGVOL = "TtlSellTradgVol"
-TTLSLLTRFVAL = "TtlSellTrfVal"
+TTLBUYTRADGVOL = "TtlBuyTradgVol"
+TTLBUYTRFVAL = "TtlBuyTrfVal"
+TTLSELLTRADGVOL = "TtlSellTradgVol"
+TTLSELLTRFVAL = "TtlSellTrfVal"
+# Earlier spellings of the four names above
+TTLBUTRADGVOL = TTLBUYTRADGVOL
+TTLBUTRFVAL = TTLBUYTRFVAL
+TTLSLLTRADGVOL = TTLSELLTRADGVOL
+TTLSLLTRFVAL = TTLSELLTRFVAL
 BUYDLVRYQTY = "BuyDlvryQty"
 BUYDLVRYVAL = "BuyDlvryVal"
 BUYOTHRTHANDLVRYQTY = "BuyOthrThanDlvryQty"
@@ -97,37 +93,10 @@ STTLMPRIC = "SttlmPric"
 BUYDLVRYSTMPDTY = "BuyDlvryStmpDty"
 BUYOTHRTHANDLVRYSTMPDTY = "BuyOthrThanDlvryStmpDty"
 STMPDTYAMT = "StmpDtyAmt"
-RMKS = "Rmks"
-RSVD1 = "Rsvd1"
-RSVD2 = "Rsvd2"
-RSVD3 = "Rsvd3"
-RSVD4 = "Rsvd4"
 
 ########################### stt header
-RPTHDR = "RptHdr"
-SGMT = "Sgmt"
-SRC = "Src"
+# Only the fields not already defined for the obligation / stamp duty headers
 TRADDT = "TradDt"
-CLCTNDT = "ClctnDt"
-DUEDT = "DueDt"
-STTLMTP = "SttlmTp"
-SCTIESSTTLMTXID = "SctiesSttlmTxId"
-CLRMMBID = "ClrMmbId"
-BRKRORCTDNPTCPTID = "BrkrOrCtdnPtcptId"
-CLNTID = "ClntId"
-TCKRSYMB = "TckrSymb"
-SCTYSRS = "SctySrs"
-FININSTRMID = "FinInstrmId"
-FININSTRMTP = "FinInstrmTp"
-ISIN = "ISIN"
-XPRYDT = "XpryDt"
-OPTNTP = "OptnTp"
-STRKPRIC = "StrkPric"
-STTLMPRIC = "SttlmPric"
-TTLBUYTRADGVOL = "TtlBuyTradgVol"
-TTLBUYTRFVAL = "TtlBuyTrfVal"
-TTLSELLTRADGVOL = "TtlSellTradgVol"
-TTLSELLTRFVAL = "TtlSellTrfVal"
 AVRGPRIC = "AvrgPric"
 BUYDLVRBLQTY = "BuyDlvrblQty"
 SELLDLVRBLQTY = "SellDlvrblQty"
@@ -148,13 +117,8 @@ OPTNTTLTXS = "OptnTtlTaxs"
 TAXBLBUYVALCALLAUCTN = "TaxblBuyValCallAuctn"
 TAXBLSELLVALCALLAUCTN = "TaxblSellValCallAuctn"
 TTLTXS = "TtlTaxs"
-RMKS = "Rmks"
-RSVD1 = "Rsvd1"
-RSVD2 = "Rsvd2"
-RSVD3 = "Rsvd3"
-RSVD4 = "Rsvd4"
 
-EXTRA_COLUMNS = [
+EXTRA_COLUMNS = (
     "Buy STT",
     "Sell STT",
     "Sell Stamp Duty",
@@ -162,29 +126,31 @@ EXTRA_COLUMNS = [
     "Buy Payable Amount",
     "Sell Receivable Amount",
     "Net Receivable \\ Payable"
-]
+)
 
-OBLIGATION_HEADER = [
-    "Sgmt", "Src", "ClrMmbId", "BrkrOrCtdnPtcptId", "FinInstrmId", "ISIN", "TckrSymb", "SctySrs", "SttlmTp",
-    "SctiesSttlmTxId", "TradRegnOrgn", "ClntId", "CtdnId", "CtdnPtcptId", "RptgDt", "FndsPayInDt", "FndsPayOutDt",
-    "CmmdtyOrScrtyPayInDt", "CmmdtyOrScrtyPayOutDt", "DalyBuyTradgVol", "DalySellTradgVol", "DalyBuyTradgVal",
-    "DalySellTradgVal", "CmltvBuyVol", "CmltvSellVol", "CmltvBuyAmt", "CmltvSellAmt", "FnlOblgtnFlg",
-]
+# Report headers are built from the field constants above, as tuples so the
+# shared module-level sequences cannot be modified by a caller
+OBLIGATION_HEADER = (
+    SGMT, SRC, CLRMMBID, BRKRORCTDNPTCPTID, FININSTRMID, ISIN, TCKRSYMB, SCTYSRS, STTLMTP,
+    SCTIESSTTLMTXID, TRADREGNORGN, CLNTID, CTDNID, CTDNPTCPTID, RPTGDT, FNDSPAYINDT, FNDSPAYOUTDT,
+    CMMDTYORSCRTYPAYINDT, CMMDTYORSCRTYPAYOUTDT, DALYBUYTRADGVOL, DALYSELLTRADGVOL, DALYBUYTRADGVAL,
+    DALYSELLTRADGVAL, CMLTVBUYVOL, CMLTVSELLVOL, CMLTVBUYAMT, CMLTVSELLAMT, FNLOBLGTNFLG,
+)
 
-STAMP_DUTY_HEADER = [
-    "RptHdr", "Sgmt", "Src", "SttlmTp", "SctiesSttlmTxId", "ClrMmbId", "BrkrOrCtdnPtcptId", "ClctnDt", "DueDt",
-    "ClntId", "CtrySubDvsn", "TckrSymb", "SctySrs", "FinInstrmId", "FinInstrmTp", "ISIN", "XpryDt", "StrkPric",
-    "OptnTp", "TtlBuyTradgVol", "TtlBuyTrfVal", "TtlSellTradgVol", "TtlSellTrfVal", "BuyDlvryQty", "BuyDlvryVal",
-    "BuyOthrThanDlvryQty", "BuyOthrThanDlvryVal", "BuyStmpDty", "SellStmpDty", "SttlmPric", "BuyDlvryStmpDty",
-    "BuyOthrThanDlvryStmpDty", "StmpDtyAmt", "Rmks", "Rsvd1", "Rsvd2", "Rsvd3", "Rsvd4"
-]
+STAMP_DUTY_HEADER = (
+    RPTHDR, SGMT, SRC, STTLMTP, SCTIESSTTLMTXID, CLRMMBID, BRKRORCTDNPTCPTID, CLCTNDT, DUEDT,
+    CLNTID, CTRYSUBDVSN, TCKRSYMB, SCTYSRS, FININSTRMID, FININSTRMTP, ISIN, XPRYDT, STRKPRIC,
+    OPTNTP, TTLBUYTRADGVOL, TTLBUYTRFVAL, TTLSELLTRADGVOL, TTLSELLTRFVAL, BUYDLVRYQTY, BUYDLVRYVAL,
+    BUYOTHRTHANDLVRYQTY, BUYOTHRTHANDLVRYVAL, BUYSTMPDTY, SELLSTMPDTY, STTLMPRIC, BUYDLVRYSTMPDTY,
+    BUYOTHRTHANDLVRYSTMPDTY, STMPDTYAMT, RMKS, RSVD1, RSVD2, RSVD3, RSVD4
+)
 
-STT_HEADER = [
-    "RptHdr", "Sgmt", "Src", "TradDt", "ClctnDt", "DueDt", "SttlmTp", "SctiesSttlmTxId", "ClrMmbId",
-    "BrkrOrCtdnPtcptId", "ClntId", "TckrSymb", "SctySrs", "FinInstrmId", "FinInstrmTp", "ISIN", "XpryDt",
-    "OptnTp", "StrkPric", "SttlmPric", "TtlBuyTradgVol", "TtlBuyTrfVal", "TtlSellTradgVol", "TtlSellTrfVal",
-    "AvrgPric", "BuyDlvrblQty", "SellDlvrblQty", "SellOthrThanDlvryQty", "BuyDlvrblVal", "SellDlvrblVal",
-    "SellOthrThanDlvryVal", "BuyDelvryTtlTaxs", "SellDelvryTtlTaxs", "SellOthrThanDelvryTtlTaxs",
-    "TaxblSellFutrsVal", "TaxblSellOptnVal", "OptnExrcQty", "OptnExrcVal", "TaxblExrcVal", "FutrsTtlTaxs",
-    "OptnTtlTaxs", "TaxblBuyValCallAuctn", "TaxblSellValCallAuctn", "TtlTaxs", "Rmks", "Rsvd1", "Rsvd2", "Rsvd3", "Rsvd4"
-]
+STT_HEADER = (
+    RPTHDR, SGMT, SRC, TRADDT, CLCTNDT, DUEDT, STTLMTP, SCTIESSTTLMTXID, CLRMMBID,
+    BRKRORCTDNPTCPTID, CLNTID, TCKRSYMB, SCTYSRS, FININSTRMID, FININSTRMTP, ISIN, XPRYDT,
+    OPTNTP, STRKPRIC, STTLMPRIC, TTLBUYTRADGVOL, TTLBUYTRFVAL, TTLSELLTRADGVOL, TTLSELLTRFVAL,
+    AVRGPRIC, BUYDLVRBLQTY, SELLDLVRBLQTY, SELLOTHRTHANDLVRQTY, BUYDLVRBLVAL, SELLDLVRBLVAL,
+    SELLOTHRTHANDLVRVAL, BUYDELVRYTTLTXS, SELLDELVRYTTLTXS, SELLOTHRTHANDELVRYTTLTXS,
+    TAXBLSELLFUTRSVAL, TAXBLSELLOPTNVAL, OPTNEXRCQTY, OPTNEXRCVAL, TAXBLEXRCVAL, FUTRSTTLMTTXS,
+    OPTNTTLTXS, TAXBLBUYVALCALLAUCTN, TAXBLSELLVALCALLAUCTN, TTLTXS, RMKS, RSVD1, RSVD2, RSVD3, RSVD4
+)
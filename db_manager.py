@@ -1,38 +1,116 @@
+import atexit
 import os
 import sqlite3
+import threading
+
+# Report files are streamed into their BLOB in chunks of this size
+_BLOB_CHUNK = 128 * 1024
+
+_INSERT_SQL = """
+    INSERT INTO pcm (type_of_report, created_at, modified_at, report_blob)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+# One shared connection per DB path. Reports are saved from the processing
+# worker threads, so the connection is not tied to its creating thread and
+# every use holds _db_lock.
+_connections = {}
+_db_lock = threading.Lock()
+
+
+def _connect(db_path):
+    """
+    Return the shared connection for db_path, opening it and applying the
+    pragmas on first use. WAL is stored in the file, so switching is a no-op
+    after the first time; the rest are per connection. synchronous=NORMAL
+    is safe with WAL (a commit only syncs at checkpoints). Call with
+    _db_lock held.
+    """
+    conn = _connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        # page_size only takes effect on a database that has no tables yet
+        conn.execute("PRAGMA page_size=8192")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # KiB, i.e. 64 MiB
+        conn.execute("PRAGMA mmap_size=268435456")
+        _connections[db_path] = conn
+    return conn
+
 
 def setup_database(db_folder="data", db_name="pcm_database.db"):
-    """Check if SQLite DB exists, if not create it."""
-    if not os.path.exists(db_folder):
-        os.makedirs(db_folder)
+    """Create the SQLite DB and its table if needed; return the DB path."""
+    os.makedirs(db_folder, exist_ok=True)
 
     db_path = os.path.join(db_folder, db_name)
 
-    if not os.path.exists(db_path):
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS pcm (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type_of_report TEXT,
-                created_at TEXT,
-                modified_at TEXT,
-                report_blob BLOB
-            )
-        """)
-        conn.commit()
-        conn.close()
+    # Opening the shared connection here also applies the pragmas once,
+    # so later inserts start on a ready connection
+    with _db_lock:
+        conn = _connect(db_path)
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pcm (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    type_of_report TEXT,
+                    created_at TEXT,
+                    modified_at TEXT,
+                    report_blob BLOB
+                )
+            """)
 
     return db_path
 
 
+@atexit.register
+def close_connections():
+    """Close the shared connections (checkpoints the WAL back into the DB)."""
+    with _db_lock:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
+
+
 def insert_report(db_path, report_type, created_at, modified_at, report_blob):
     """Insert report into database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO pcm (type_of_report, created_at, modified_at, report_blob)
-        VALUES (?, ?, ?, ?)
-    """, (report_type, created_at, modified_at, report_blob))
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = _connect(db_path)
+        with conn:
+            conn.execute(_INSERT_SQL, (report_type, created_at, modified_at, report_blob))
+
+
+def insert_reports(db_path, rows):
+    """
+    Insert many reports in one transaction.
+    rows: iterable of (report_type, created_at, modified_at, report_blob)
+    """
+    with _db_lock:
+        conn = _connect(db_path)
+        with conn:
+            conn.executemany(_INSERT_SQL, rows)
+
+
+def insert_report_file(db_path, report_type, created_at, modified_at, file_path):
+    """
+    Insert a report whose content is a file on disk, without loading the
+    whole file into memory: the row is inserted with a zero-filled BLOB of
+    the right size which is then filled in chunks (Python 3.11+ blobopen).
+    """
+    with _db_lock, open(file_path, "rb") as f:
+        conn = _connect(db_path)
+        if not hasattr(conn, "blobopen"):
+            with conn:
+                conn.execute(_INSERT_SQL, (report_type, created_at, modified_at, f.read()))
+            return
+        size = os.fstat(f.fileno()).st_size
+        with conn:
+            cursor = conn.execute("""
+                INSERT INTO pcm (type_of_report, created_at, modified_at, report_blob)
+                VALUES (?, ?, ?, zeroblob(?))
+            """, (report_type, created_at, modified_at, size))
+            with conn.blobopen("pcm", "report_blob", cursor.lastrowid) as blob:
+                for chunk in iter(lambda: f.read(_BLOB_CHUNK), b""):
+                    blob.write(chunk)
@@ -7,20 +7,81 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import os
+import re
+import threading
+from datetime import date
 from email_sender import EmailSender
 from utils import Constants
 
 
+# Loose shape check for one address - enough to catch typos before connecting
+_ADDR_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_ADDR_SEP_RE = re.compile(r"[,;]")
+
+
+def _split_addrs(text):
+    """Addresses from a comma/semicolon separated field, blanks dropped"""
+    return [addr for addr in (part.strip() for part in _ADDR_SEP_RE.split(text)) if addr]
+
+
 class EmailConfigPage:
     """Email configuration page with normal view"""
     
+    # File type filters offered by the attachment picker
+    _FILETYPES = (
+        ("All files", "*.*"),
+        ("PDF files", "*.pdf"),
+        ("Word documents", "*.doc;*.docx"),
+        ("Excel files", "*.xls;*.xlsx"),
+        ("Images", "*.jpg;*.jpeg;*.png;*.gif"),
+        ("Text files", "*.txt")
+    )
+    
+    # Entry fields of the SMTP grid: (label, var attribute, width, row, label column, show)
+    _SMTP_FIELDS = (
+        ("SMTP Server:", 'smtp_server_var', 30, 0, 0, ''),
+        ("Port:", 'smtp_port_var', 10, 0, 2, ''),
+        ("Email Address:", 'email_address_var', 30, 1, 0, ''),
+        ("Password:", 'email_password_var', 20, 1, 2, '*'),
+    )
+    
+    # Single-line fields of the composition grid, same layout as _SMTP_FIELDS
+    _COMPOSITION_FIELDS = (
+        ("To:", 'to_var', 70, 0, 0, ''),
+        ("CC:", 'cc_var', 70, 1, 0, ''),
+        ("BCC:", 'bcc_var', 70, 2, 0, ''),
+        ("Subject:", 'subject_var', 70, 3, 0, ''),
+    )
+    
+    # Config keys written by _save_configuration
+    _SAVED_KEYS = ('smtp_server', 'smtp_port', 'email_address', 'email_password',
+                   'default_to', 'default_cc', 'default_bcc', 'default_subject',
+                   'default_body', 'use_tls', 'use_ssl')
+    
+    # Default email body; only the date changes
+    _BODY_TEMPLATE = """Dear Sir/Madam,
+
+Please find attached PS04 as at end of day {date}.
+
+The password for opening the 'ZIP' file will be your PAN."""
+    
+    # (day, formatted day) of the last date formatted, shared by all instances
+    _cached_date = (None, '')
+    
     def __init__(self, parent):
         self.parent = parent
         self.email_sender = EmailSender()
         self.attachments = []
+        # Settings as last loaded from / saved to the config file
+        self._saved_config = None
+        # SMTP test/send run on daemon threads so the page keeps redrawing
+        # meanwhile and closing the app never waits on an SMTP timeout.
+        # Set once the page is destroyed; workers then drop their results.
+        self._closed = False
         
         # Create main frame with company legacy color
         self.frame = tk.Frame(parent, bg=Constants.PROCESSING_BG)
+        self.frame.bind("<Destroy>", self._on_destroy)
         
         # Create normal view
         self._create_normal_view()
@@ -47,12 +108,10 @@ class EmailConfigPage:
         self._create_email_composition_section()
         self._create_attachments_section()
         self._create_action_buttons_section()
+        self._create_loading_overlay()
         
         # Load current configuration
         self._load_configuration()
-        
-        # Bind mousewheel to all child widgets for better scrolling coverage
-        self.frame.after(100, self._bind_mousewheel_to_all_children)
     
     
     def _create_scrollable_frame(self):
@@ -62,10 +121,18 @@ class EmailConfigPage:
         self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = tk.Frame(self.canvas, bg=Constants.PROCESSING_BG)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Building the page resizes the frame once per packed child; update the
+        # scrollregion once per idle cycle rather than on every one of them
+        self._scrollregion_after_id = None
+        self._has_content = False  # whether there is anything to scroll, set with the scrollregion
+        self._pending_delta = 0  # wheel delta gathered since the last scroll
+        self._pending_scroll = None
+        
+        def _on_frame_configure(event):
+            if self._scrollregion_after_id is None:
+                self._scrollregion_after_id = self.frame.after_idle(self._update_scrollregion)
+        
+        self.scrollable_frame.bind("<Configure>", _on_frame_configure)
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -74,51 +141,54 @@ class EmailConfigPage:
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        # Bind mousewheel
-        def _on_mousewheel(event):
-            if self.canvas.bbox("all"):
-                self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        # Bind mousewheel to canvas
-        self.canvas.bind("<MouseWheel>", _on_mousewheel)
-        
-        # Bind mousewheel to scrollable frame
-        self.scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
+        # Bind mousewheel once for the whole page: every widget carries its
+        # toplevel in its bindtags, so a binding there sees wheel events from
+        # all of this page's widgets, including ones created later
+        frame_path = str(self.frame)
+        child_prefix = frame_path + '.'
         
-        # Bind mousewheel to the main frame for better coverage
-        self.frame.bind("<MouseWheel>", _on_mousewheel)
-        
-        # Store the mousewheel function for binding to child widgets
-        self._mousewheel_handler = _on_mousewheel
-    
-    def _bind_mousewheel_to_all_children(self):
-        """Recursively bind mousewheel to all child widgets for better scrolling coverage"""
-        if hasattr(self, '_mousewheel_handler'):
-            self._bind_mousewheel_to_widget(self.frame)
-    
-    def _bind_mousewheel_to_widget(self, widget):
-        """Bind mousewheel event to a specific widget and all its children"""
-        if hasattr(self, '_mousewheel_handler'):
+        def _on_mousewheel(event):
+            widget_path = str(event.widget)
+            if widget_path != frame_path and not widget_path.startswith(child_prefix):
+                return  # another page's widget
+            if self._has_content:
+                # A fast wheel fires many events; scroll once per idle cycle
+                self._pending_delta += event.delta
+                if self._pending_scroll is None:
+                    self._pending_scroll = self.frame.after_idle(self._flush_scroll)
+        
+        self.frame.winfo_toplevel().bind("<MouseWheel>", _on_mousewheel, add="+")
+    
+    def _update_scrollregion(self):
+        """Fit the canvas scrollregion to the page content"""
+        self._scrollregion_after_id = None
+        bbox = self.canvas.bbox("all")
+        self.canvas.configure(scrollregion=bbox)
+        # Wheel events check this instead of measuring the canvas each time
+        self._has_content = bbox is not None and bbox[3] > bbox[1]
+    
+    def _flush_scroll(self):
+        """Apply the wheel delta gathered since the last idle cycle in one scroll"""
+        delta, self._pending_delta = self._pending_delta, 0
+        self._pending_scroll = None
+        units = int(-1*(delta/120))
+        if units:
+            self.canvas.yview_scroll(units, "units")
+    
+    def _sec_trace(self, name, index, mode):
+        """TLS/SSL variable trace - keep the two mutually exclusive, the one just checked wins"""
+        if self._sec_lock:
+            return  # our own uncheck of the other option
+        if name == str(self.use_tls_var):
+            changed, other = self.use_tls_var, self.use_ssl_var
+        else:
+            changed, other = self.use_ssl_var, self.use_tls_var
+        if changed.get():
+            self._sec_lock = True
             try:
-                widget.bind("<MouseWheel>", self._mousewheel_handler)
-            except:
-                pass  # Some widgets might not support binding
-            
-            # Recursively bind to all children
-            for child in widget.winfo_children():
-                self._bind_mousewheel_to_widget(child)
-    
-    def _on_tls_change(self):
-        """Handle TLS checkbox change - make it mutually exclusive with SSL"""
-        if self.use_tls_var.get():
-            # If TLS is checked, uncheck SSL
-            self.use_ssl_var.set(False)
-    
-    def _on_ssl_change(self):
-        """Handle SSL checkbox change - make it mutually exclusive with TLS"""
-        if self.use_ssl_var.get():
-            # If SSL is checked, uncheck TLS
-            self.use_tls_var.set(False)
+                other.set(False)
+            finally:
+                self._sec_lock = False
     
     def _create_smtp_config_section(self):
         """Create SMTP configuration section"""
@@ -134,37 +204,8 @@ class EmailConfigPage:
         config_grid = tk.Frame(smtp_frame, bg=Constants.PROCESSING_BG)
         config_grid.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        # SMTP Server
-        tk.Label(config_grid, text="SMTP Server:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=0, column=0, sticky=tk.W, padx=(0, 10), pady=5)
-        self.smtp_server_var = tk.StringVar()
-        smtp_entry = tk.Entry(config_grid, textvariable=self.smtp_server_var, width=30,
-                             font=Constants.SMALL_FONT)
-        smtp_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 20), pady=5)
-        
-        # SMTP Port
-        tk.Label(config_grid, text="Port:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=0, column=2, sticky=tk.W, padx=(0, 10), pady=5)
-        self.smtp_port_var = tk.StringVar()
-        port_entry = tk.Entry(config_grid, textvariable=self.smtp_port_var, width=10,
-                            font=Constants.SMALL_FONT)
-        port_entry.grid(row=0, column=3, sticky=tk.W, pady=5)
-        
-        # Email Address
-        tk.Label(config_grid, text="Email Address:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=5)
-        self.email_address_var = tk.StringVar()
-        email_entry = tk.Entry(config_grid, textvariable=self.email_address_var, width=30,
-                             font=Constants.SMALL_FONT)
-        email_entry.grid(row=1, column=1, sticky=tk.W, padx=(0, 20), pady=5)
-        
-        # Email Password
-        tk.Label(config_grid, text="Password:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=1, column=2, sticky=tk.W, padx=(0, 10), pady=5)
-        self.email_password_var = tk.StringVar()
-        password_entry = tk.Entry(config_grid, textvariable=self.email_password_var, width=20,
-                                font=Constants.SMALL_FONT, show='*')
-        password_entry.grid(row=1, column=3, sticky=tk.W, pady=5)
+        # SMTP server, port, email address and password
+        self._create_grid_fields(config_grid, self._SMTP_FIELDS)
         
         # Security options
         security_frame = tk.Frame(smtp_frame, bg=Constants.PROCESSING_BG)
@@ -172,22 +213,39 @@ class EmailConfigPage:
         
         self.use_tls_var = tk.BooleanVar(value=True)
         tls_check = tk.Checkbutton(security_frame, text="Use TLS", variable=self.use_tls_var,
-                                 font=Constants.SMALL_FONT, bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT,
-                                 command=self._on_tls_change)
+                                 font=Constants.SMALL_FONT, bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT)
         tls_check.pack(side=tk.LEFT, padx=(0, 20))
         
         self.use_ssl_var = tk.BooleanVar(value=False)
         ssl_check = tk.Checkbutton(security_frame, text="Use SSL", variable=self.use_ssl_var,
-                                font=Constants.SMALL_FONT, bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT,
-                                command=self._on_ssl_change)
+                                font=Constants.SMALL_FONT, bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT)
         ssl_check.pack(side=tk.LEFT, padx=(0, 20))
         
+        # TLS and SSL are mutually exclusive; enforced for clicks and loads alike
+        self._sec_lock = False
+        self.use_tls_var.trace_add("write", self._sec_trace)
+        self.use_ssl_var.trace_add("write", self._sec_trace)
+        
         # Test connection button
         test_btn = tk.Button(security_frame, text="🔍 Test Connection", 
                            command=self._test_connection, bg=Constants.SECONDARY_BTN, fg='white',
                            font=Constants.BUTTON_FONT, relief=tk.FLAT, padx=15, pady=5)
         test_btn.pack(side=tk.RIGHT)
     
+    def _create_grid_fields(self, grid, fields):
+        """Create a label + entry (bound to a new StringVar attribute) per field row"""
+        label_kw = dict(font=Constants.LABEL_FONT, bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT)
+        for label, var_attr, width, row, column, show in fields:
+            tk.Label(grid, text=label, **label_kw).grid(
+                row=row, column=column, sticky=tk.W, padx=(0, 10), pady=5)
+            var = tk.StringVar()
+            setattr(self, var_attr, var)
+            entry = tk.Entry(grid, textvariable=var, width=width,
+                             font=Constants.SMALL_FONT, show=show)
+            # Only the first pair in a row keeps a gap before the next one
+            entry.grid(row=row, column=column + 1, sticky=tk.W,
+                       padx=(0, 20) if column == 0 else 0, pady=5)
+    
     def _create_email_composition_section(self):
         """Create email composition section"""
         comp_frame = tk.Frame(self.scrollable_frame, bg=Constants.PROCESSING_BG, relief=tk.RIDGE, bd=1)
@@ -202,37 +260,8 @@ class EmailConfigPage:
         comp_grid = tk.Frame(comp_frame, bg=Constants.PROCESSING_BG)
         comp_grid.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        # To field
-        tk.Label(comp_grid, text="To:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=0, column=0, sticky=tk.W, padx=(0, 10), pady=5)
-        self.to_var = tk.StringVar()
-        to_entry = tk.Entry(comp_grid, textvariable=self.to_var, width=70,
-                           font=Constants.SMALL_FONT)
-        to_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 20), pady=5)
-        
-        # CC field
-        tk.Label(comp_grid, text="CC:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=5)
-        self.cc_var = tk.StringVar()
-        cc_entry = tk.Entry(comp_grid, textvariable=self.cc_var, width=70,
-                          font=Constants.SMALL_FONT)
-        cc_entry.grid(row=1, column=1, sticky=tk.W, padx=(0, 20), pady=5)
-        
-        # BCC field
-        tk.Label(comp_grid, text="BCC:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=2, column=0, sticky=tk.W, padx=(0, 10), pady=5)
-        self.bcc_var = tk.StringVar()
-        bcc_entry = tk.Entry(comp_grid, textvariable=self.bcc_var, width=70,
-                           font=Constants.SMALL_FONT)
-        bcc_entry.grid(row=2, column=1, sticky=tk.W, padx=(0, 20), pady=5)
-        
-        # Subject field
-        tk.Label(comp_grid, text="Subject:", font=Constants.LABEL_FONT,
-                bg=Constants.PROCESSING_BG, fg=Constants.PRIMARY_TEXT).grid(row=3, column=0, sticky=tk.W, padx=(0, 10), pady=5)
-        self.subject_var = tk.StringVar()
-        subject_entry = tk.Entry(comp_grid, textvariable=self.subject_var, width=70,
-                               font=Constants.SMALL_FONT)
-        subject_entry.grid(row=3, column=1, sticky=tk.W, padx=(0, 20), pady=5)
+        # To, CC, BCC and Subject fields
+        self._create_grid_fields(comp_grid, self._COMPOSITION_FIELDS)
         
         # Body field
         tk.Label(comp_grid, text="Body:", font=Constants.LABEL_FONT,
@@ -245,10 +274,6 @@ class EmailConfigPage:
         body_scrollbar = ttk.Scrollbar(comp_grid, orient="vertical", command=self.body_text.yview)
         self.body_text.configure(yscrollcommand=body_scrollbar.set)
         body_scrollbar.grid(row=4, column=2, sticky=tk.NS, pady=5)
-        
-        # Bind mousewheel to text widget for scrolling
-        if hasattr(self, '_mousewheel_handler'):
-            self.body_text.bind("<MouseWheel>", self._mousewheel_handler)
     
     def _create_attachments_section(self):
         """Create attachments section"""
@@ -265,13 +290,10 @@ class EmailConfigPage:
         attach_content.pack(fill=tk.X, padx=20, pady=(0, 15))
         
         # Listbox for attachments
-        self.attachments_listbox = tk.Listbox(attach_content, height=4, font=Constants.SMALL_FONT)
+        self.attachments_listbox = tk.Listbox(attach_content, height=4, font=Constants.SMALL_FONT,
+                                              selectmode=tk.EXTENDED)
         self.attachments_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
-        # Bind mousewheel to listbox for scrolling
-        if hasattr(self, '_mousewheel_handler'):
-            self.attachments_listbox.bind("<MouseWheel>", self._mousewheel_handler)
-        
         # Attachment buttons
         attach_buttons = tk.Frame(attach_content, bg=Constants.PROCESSING_BG)
         attach_buttons.pack(side=tk.RIGHT)
@@ -306,11 +328,11 @@ class EmailConfigPage:
                            font=Constants.BUTTON_FONT, relief=tk.FLAT, padx=20, pady=8)
         save_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        # Send email button
-        send_btn = tk.Button(buttons_frame, text="📤 Send Email", 
-                           command=self._send_email, bg=Constants.PRIMARY_BTN, fg='white',
-                           font=Constants.BUTTON_FONT, relief=tk.FLAT, padx=20, pady=8)
-        send_btn.pack(side=tk.LEFT, padx=(0, 10))
+        # Send email button - kept so it can be disabled while a send runs
+        self._send_btn = tk.Button(buttons_frame, text="📤 Send Email", 
+                                   command=self._send_email, bg=Constants.PRIMARY_BTN, fg='white',
+                                   font=Constants.BUTTON_FONT, relief=tk.FLAT, padx=20, pady=8)
+        self._send_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Load defaults button
         load_btn = tk.Button(buttons_frame, text="🔄 Load Defaults", 
@@ -331,6 +353,7 @@ class EmailConfigPage:
         """Load current email configuration"""
         try:
             config = self.email_sender.get_config()
+            self._saved_config = {key: config.get(key) for key in self._SAVED_KEYS}
             
             # SMTP settings
             self.smtp_server_var.set(config.get('smtp_server', ''))
@@ -351,7 +374,7 @@ class EmailConfigPage:
             self.subject_var.set(default_subject)
             
             # Set default body with dynamic date
-            default_body = self._get_default_body()
+            default_body = self._get_default_body(current_date)
             self.body_text.delete(1.0, tk.END)
             self.body_text.insert(1.0, default_body)
             
@@ -359,24 +382,37 @@ class EmailConfigPage:
             messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
     
     def _get_current_date_formatted(self):
-        """Get current date in DD MMM YYYY format"""
-        from datetime import datetime
-        return datetime.now().strftime("%d %b %Y")
-    
-    def _get_default_body(self):
+        """Get current date in DD MMM YYYY format (formatted once per day)"""
+        today = date.today()
+        cached_day, formatted = EmailConfigPage._cached_date
+        if cached_day != today:
+            formatted = today.strftime("%d %b %Y")
+            EmailConfigPage._cached_date = (today, formatted)
+        return formatted
+    
+    def _get_default_body(self, current_date=None):
         """Get default email body with current date"""
-        current_date = self._get_current_date_formatted()
-        return f"""Dear Sir/Madam,
-
-Please find attached PS04 as at end of day {current_date}.
-
-The password for opening the 'ZIP' file will be your PAN."""
-    
-    def _save_configuration(self, show_message=True):
-        """Save email configuration"""
+        if current_date is None:
+            current_date = self._get_current_date_formatted()
+        return self._BODY_TEMPLATE.format(date=current_date)
+    
+    def _get_body_text(self):
+        """Body text without Tk's trailing newline or surrounding whitespace"""
+        # "end-1c" leaves out the newline Tk always appends, so strip() only
+        # copies when the user left whitespace at either end
+        return self.body_text.get("1.0", "end-1c").strip()
+    
+    def _save_configuration(self, show_message=True, body=None):
+        """
+        Save email configuration. body: the already-fetched body text, if
+        the caller has it. The silent save before Test/Send is skipped when
+        nothing changed since the last load/save.
+        """
         try:
-            # Update email sender configuration
-            self.email_sender.update_config(
+            if body is None:
+                body = self._get_body_text()
+            
+            config = dict(
                 smtp_server=self.smtp_server_var.get(),
                 smtp_port=int(self.smtp_port_var.get()) if self.smtp_port_var.get() else 587,
                 email_address=self.email_address_var.get(),
@@ -385,11 +421,16 @@ The password for opening the 'ZIP' file will be your PAN."""
                 default_cc=self.cc_var.get(),
                 default_bcc=self.bcc_var.get(),
                 default_subject=self.subject_var.get(),
-                default_body=self.body_text.get(1.0, tk.END).strip(),
+                default_body=body,
                 use_tls=self.use_tls_var.get(),
                 use_ssl=self.use_ssl_var.get()
             )
             
+            # Update email sender configuration
+            if show_message or config != self._saved_config:
+                if self.email_sender.update_config(**config):
+                    self._saved_config = config
+            
             if show_message:
                 messagebox.showinfo("Success", "Configuration saved successfully!")
             
@@ -402,35 +443,54 @@ The password for opening the 'ZIP' file will be your PAN."""
             # Save current config first
             self._save_configuration(show_message=False)
             
-            # Test connection
-            success, message = self.email_sender.test_connection()
-            
-            if success:
-                messagebox.showinfo("Connection Test", f"✅ {message}")
-            else:
-                messagebox.showerror("Connection Test", f"❌ {message}")
+            # Test connection in the background; the result is shown back on the UI thread
+            threading.Thread(target=self._test_connection_thread, daemon=True).start()
                 
         except Exception as e:
             messagebox.showerror("Error", f"Connection test failed: {str(e)}")
     
+    def _test_connection_thread(self):
+        """Run the connection test on a worker thread"""
+        try:
+            success, message = self.email_sender.test_connection()
+        except Exception as e:
+            self._post(lambda: messagebox.showerror("Error", f"Connection test failed: {str(e)}"))
+            return
+        self._post(self._show_test_result, success, message)
+    
+    def _show_test_result(self, success, message):
+        """Show the outcome of a finished connection test"""
+        if success:
+            messagebox.showinfo("Connection Test", f"✅ {message}")
+        else:
+            messagebox.showerror("Connection Test", f"❌ {message}")
+    
     def _send_email(self):
         """Send email"""
         try:
+            # Fetch the body once; it is saved, validated and sent as the same string
+            body = self._get_body_text()
+            
             # Save current config first
-            self._save_configuration(show_message=False)
+            self._save_configuration(show_message=False, body=body)
             
             # Get email content
-            to = self.to_var.get().strip()
+            to = _split_addrs(self.to_var.get())
             subject = self.subject_var.get().strip()
-            body = self.body_text.get(1.0, tk.END).strip()
-            cc = self.cc_var.get().strip()
-            bcc = self.bcc_var.get().strip()
+            cc = _split_addrs(self.cc_var.get())
+            bcc = _split_addrs(self.bcc_var.get())
             
             # Validate required fields
             if not to:
                 messagebox.showerror("Error", "Please enter recipient email address")
                 return
             
+            # Reject mistyped addresses here rather than after an SMTP round-trip
+            invalid = [addr for addr in to + cc + bcc if not _ADDR_RE.match(addr)]
+            if invalid:
+                messagebox.showerror("Error", "Invalid email address(es):\n" + "\n".join(invalid))
+                return
+            
             if not subject:
                 messagebox.showerror("Error", "Please enter email subject")
                 return
@@ -442,8 +502,7 @@ The password for opening the 'ZIP' file will be your PAN."""
             # Show loading message
             self._show_loading_message()
             
-            # Send email in a separate thread to avoid blocking UI
-            import threading
+            # Send email in separate thread to avoid blocking UI
             threading.Thread(target=self._send_email_thread, args=(to, subject, body, cc, bcc), daemon=True).start()
                 
         except Exception as e:
@@ -451,7 +510,7 @@ The password for opening the 'ZIP' file will be your PAN."""
             messagebox.showerror("Error", f"Failed to send email: {str(e)}")
     
     def _send_email_thread(self, to, subject, body, cc, bcc):
-        """Send email in separate thread"""
+        """Send email on a worker thread"""
         try:
             # Send email
             success, message = self.email_sender.send_email(
@@ -464,25 +523,38 @@ The password for opening the 'ZIP' file will be your PAN."""
             )
             
             # Hide loading message and show result
-            self.frame.after(0, self._hide_loading_message)
+            self._post(self._hide_loading_message)
             
             if success:
-                self.frame.after(0, lambda: self._show_success_message(message))
+                self._post(lambda: self._show_success_message(message))
             else:
-                self.frame.after(0, lambda: messagebox.showerror("Email Failed", f"❌ {message}"))
+                self._post(lambda: messagebox.showerror("Email Failed", f"❌ {message}"))
                 
         except Exception as e:
-            self.frame.after(0, self._hide_loading_message)
-            self.frame.after(0, lambda: messagebox.showerror("Error", f"Failed to send email: {str(e)}"))
+            self._post(self._hide_loading_message)
+            self._post(lambda: messagebox.showerror("Error", f"Failed to send email: {str(e)}"))
     
-    def _show_loading_message(self):
-        """Show loading message overlay"""
-        # Create loading overlay
-        self.loading_frame = tk.Frame(self.frame, bg='#A3C39E', relief=tk.RAISED, bd=2)
-        self.loading_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+    def _post(self, callback, *args):
+        """Run callback on the UI thread (from a worker), unless the page is gone"""
+        if self._closed:
+            return
+        try:
+            if self.frame.winfo_exists():
+                self.frame.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was closed while the worker was running
+            pass
+    
+    def _on_destroy(self, event):
+        if event.widget is self.frame:
+            self._closed = True
+    
+    def _create_loading_overlay(self):
+        """Build the 'sending' overlay once; it is placed/hidden per send"""
+        self._loading_frame = tk.Frame(self.frame, bg='#A3C39E', relief=tk.RAISED, bd=2)
         
         # Loading content
-        loading_content = tk.Frame(self.loading_frame, bg='#ffffff', relief=tk.RAISED, bd=2)
+        loading_content = tk.Frame(self._loading_frame, bg='#ffffff', relief=tk.RAISED, bd=2)
         loading_content.pack(padx=20, pady=20)
         
         # Loading icon and text
@@ -494,106 +566,85 @@ The password for opening the 'ZIP' file will be your PAN."""
         wait_label = tk.Label(loading_content, text="Please wait while we send your email", 
                             font=Constants.SMALL_FONT, bg='#ffffff', fg=Constants.SECONDARY_TEXT)
         wait_label.pack(pady=(0, 15))
+    
+    def _show_loading_message(self):
+        """Show loading message overlay"""
+        self._loading_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._loading_frame.lift()
         
         # Disable send button to prevent multiple sends
-        self._disable_send_button()
+        self._send_btn.config(state='disabled')
     
     def _hide_loading_message(self):
         """Hide loading message overlay"""
-        if hasattr(self, 'loading_frame'):
-            self.loading_frame.destroy()
-            delattr(self, 'loading_frame')
+        self._loading_frame.place_forget()
         
         # Re-enable send button
-        self._enable_send_button()
+        self._send_btn.config(state='normal')
     
     def _show_success_message(self, message):
         """Show success message"""
         messagebox.showinfo("Email Sent Successfully", f"✅ {message}")
     
-    def _disable_send_button(self):
-        """Disable send button during email sending"""
-        # Find and disable send button
-        for widget in self.frame.winfo_children():
-            self._disable_button_recursive(widget, "📤 Send Email")
-    
-    def _enable_send_button(self):
-        """Enable send button after email sending"""
-        # Find and enable send button
-        for widget in self.frame.winfo_children():
-            self._enable_button_recursive(widget, "📤 Send Email")
-    
-    def _disable_button_recursive(self, widget, button_text):
-        """Recursively find and disable button with specific text"""
-        if isinstance(widget, tk.Button) and widget.cget('text') == button_text:
-            widget.config(state='disabled')
-        for child in widget.winfo_children():
-            self._disable_button_recursive(child, button_text)
-    
-    def _enable_button_recursive(self, widget, button_text):
-        """Recursively find and enable button with specific text"""
-        if isinstance(widget, tk.Button) and widget.cget('text') == button_text:
-            widget.config(state='normal')
-        for child in widget.winfo_children():
-            self._enable_button_recursive(child, button_text)
-    
     def _add_attachment(self):
-        """Add file attachment"""
+        """Add file attachments (several can be picked at once)"""
         try:
-            file_path = filedialog.askopenfilename(
-                title="Select file to attach",
-                filetypes=[
-                    ("All files", "*.*"),
-                    ("PDF files", "*.pdf"),
-                    ("Word documents", "*.doc;*.docx"),
-                    ("Excel files", "*.xls;*.xlsx"),
-                    ("Images", "*.jpg;*.jpeg;*.png;*.gif"),
-                    ("Text files", "*.txt")
-                ]
+            file_paths = filedialog.askopenfilenames(
+                title="Select files to attach",
+                filetypes=self._FILETYPES
             )
             
-            if file_path:
-                self.attachments.append(file_path)
-                filename = os.path.basename(file_path)
-                self.attachments_listbox.insert(tk.END, filename)
+            if file_paths:
+                self.attachments.extend(file_paths)
+                # One listbox insert for the whole batch
+                self.attachments_listbox.insert(tk.END, *map(os.path.basename, file_paths))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add attachment: {str(e)}")
     
     def _remove_attachment(self):
-        """Remove selected attachment"""
+        """Remove the selected attachments"""
         try:
             selection = self.attachments_listbox.curselection()
             if selection:
-                index = selection[0]
-                self.attachments_listbox.delete(index)
-                self.attachments.pop(index)
+                # Bottom-up, so the remaining indexes stay valid
+                for index in reversed(selection):
+                    self.attachments_listbox.delete(index)
+                # Keep the order (it is the listbox row order) and drop all in one pass
+                removed = set(selection)
+                self.attachments[:] = [path for i, path in enumerate(self.attachments)
+                                       if i not in removed]
             else:
-                messagebox.showwarning("Warning", "Please select an attachment to remove")
+                messagebox.showwarning("Warning", "Please select attachments to remove")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to remove attachment: {str(e)}")
     
+    def _reset_fields(self, smtp_server="", smtp_port=""):
+        """Blank every field except the given SMTP server/port and drop all attachments"""
+        self.smtp_server_var.set(smtp_server)
+        self.smtp_port_var.set(smtp_port)
+        self.email_address_var.set("")
+        self.email_password_var.set("")
+        
+        self.to_var.set("")
+        self.cc_var.set("")
+        self.bcc_var.set("")
+        self.subject_var.set("")
+        self.body_text.delete(1.0, tk.END)
+        
+        # Clear attachments
+        if self.attachments:
+            self.attachments_listbox.delete(0, tk.END)
+            self.attachments.clear()
+    
     def _load_defaults(self):
         """Load default configuration"""
         try:
             # Reset to default values
-            self.smtp_server_var.set("smtp.gmail.com")
-            self.smtp_port_var.set("587")
-            self.email_address_var.set("")
-            self.email_password_var.set("")
+            self._reset_fields("smtp.gmail.com", "587")
+            # The TLS/SSL trace unchecks SSL when TLS is set
             self.use_tls_var.set(True)
-            self.use_ssl_var.set(False)
-            
-            self.to_var.set("")
-            self.cc_var.set("")
-            self.bcc_var.set("")
-            self.subject_var.set("")
-            self.body_text.delete(1.0, tk.END)
-            
-            # Clear attachments
-            self.attachments_listbox.delete(0, tk.END)
-            self.attachments.clear()
             
             messagebox.showinfo("Success", "Default configuration loaded!")
             
@@ -604,20 +655,7 @@ The password for opening the 'ZIP' file will be your PAN."""
         """Clear all fields"""
         try:
             if messagebox.askyesno("Confirm", "Are you sure you want to clear all fields?"):
-                self.smtp_server_var.set("")
-                self.smtp_port_var.set("")
-                self.email_address_var.set("")
-                self.email_password_var.set("")
-                
-                self.to_var.set("")
-                self.cc_var.set("")
-                self.bcc_var.set("")
-                self.subject_var.set("")
-                self.body_text.delete(1.0, tk.END)
-                
-                # Clear attachments
-                self.attachments_listbox.delete(0, tk.END)
-                self.attachments.clear()
+                self._reset_fields()
                 
                 messagebox.showinfo("Success", "All fields cleared!")
                 
@@ -643,6 +681,6 @@ The password for opening the 'ZIP' file will be your PAN."""
             'cc': self.cc_var.get(),
             'bcc': self.bcc_var.get(),
             'subject': self.subject_var.get(),
-            'body': self.body_text.get(1.0, tk.END).strip(),
+            'body': self._get_body_text(),
             'attachments': self.attachments.copy()
         }
@@ -1,10 +1,63 @@
 import tkinter as tk
-from tkinter import messagebox
-import tempfile
-import zipfile
+from tkinter import ttk, messagebox
 import os
+import re
 import sys
-from outlook_email import send_outlook_email
+import threading
+
+# Recipients may be separated by commas, semicolons or newlines, mixed
+_SPLIT_RE = re.compile(r"[,;\n]+")
+# Same rule as before: one @, a non-empty local part and a dotted domain
+_EMAIL_RE = re.compile(r"[^@]+@[^@]*\.[^@]*")
+
+# Dialog colours and fonts
+_BG = "#ecf0f1"
+_FG = "#2c3e50"
+_FONT = ("Arial", 9)
+_NOTE_FONT = ("Arial", 8)
+_LABEL_FONT = ("Arial", 10)
+_BOLD_FONT = ("Arial", 10, "bold")
+_TITLE_FONT = ("Arial", 14, "bold")
+
+# Shared label options for the dialog's field captions
+_LABEL_STYLE = {"font": _LABEL_FONT, "bg": _BG, "fg": _FG}
+_TITLE_STYLE = {**_LABEL_STYLE, "font": _TITLE_FONT}
+
+
+def _mk_label(parent, text, **overrides):
+    """Create a dialog label; keyword options override _LABEL_STYLE."""
+    return tk.Label(parent, text=text, **{**_LABEL_STYLE, **overrides})
+
+
+def _parse_and_validate(email_text):
+    """
+    Parse and validate email addresses from text input in one pass.
+    Supports multiple formats:
+    - One email per line
+    - Comma-separated emails
+    - Semicolon-separated emails
+    - Mixed formats
+    
+    Args:
+        email_text (str): Raw email input text
+        
+    Returns:
+        tuple: (valid, invalid) lists of addresses, stripped, de-duplicated
+        and in input order
+    """
+    valid = []
+    invalid = []
+    if not email_text:
+        return valid, invalid
+    
+    seen = set()
+    for email in _SPLIT_RE.split(email_text):
+        email = email.strip()
+        if email and email not in seen:
+            seen.add(email)
+            # Basic validation: one @, a local part and a dotted domain
+            (valid if _EMAIL_RE.fullmatch(email) else invalid).append(email)
+    return valid, invalid
 
 
 class EmailDialog(tk.Toplevel):
@@ -27,116 +80,93 @@ class EmailDialog(tk.Toplevel):
         self.zip_path = zip_path
         self.file_list = file_list
         self.temp_dir = None
+        # True while separate emails are being sent on the worker thread
+        self._sending = False
         
         self.title("Send Email via Outlook")
-        self.geometry("500x500")
-        self.configure(bg="#ecf0f1")
+        self.configure(bg=_BG)
         self.resizable(True, True)
         self.minsize(500, 450)
         
         # Load icon
         self._load_icon()
         
-        # Center the dialog on screen
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() // 2) - (self.winfo_width() // 2)
-        y = (self.winfo_screenheight() // 2) - (self.winfo_height() // 2)
-        self.geometry(f"+{x}+{y}")
+        # Center the dialog on screen. The size is fixed here, so there is
+        # no need for a layout pass to measure the (still empty) window.
+        width, height = 500, 500
+        x = (self.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.winfo_screenheight() // 2) - (height // 2)
+        self.geometry(f"{width}x{height}+{x}+{y}")
         
         # Make dialog modal
         self.transient(parent)
         self.grab_set()
+        # Closing the window goes through Cancel so it waits for a running send
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         
         # Default values - use provided values or fall back to defaults
         self.default_subject = default_subject if default_subject is not None else "Daily_Trade_File"
         self.default_email = default_email if default_email is not None else ""
         self.default_body = default_body if default_body is not None else ""
         
-        # Store checkboxes for file selection (initialize before _create_widgets)
-        self.file_vars = {}
+        # Attachment names in list order without duplicates, and the checked
+        # ones (all by default). Plain Python state, no Tcl variable per file;
+        # initialize before _create_widgets
+        self._file_names = list(dict.fromkeys(file_list))
+        self._selected = set(self._file_names)
+        
+        # Arrow-key scroll gathered since the last idle cycle
+        self._pending_units = 0
+        self._pending_scroll = None
         
         # Create UI
         self._create_widgets()
         
-        # Set focus to canvas after widgets are created so arrow keys work immediately
-        self.after(100, self._focus_attachments_box)
-        
         # Bind arrow keys to dialog window so they work globally
         self.bind("<Up>", self._on_dialog_arrow_up)
         self.bind("<Down>", self._on_dialog_arrow_down)
         
-        # Set focus to canvas after widgets are created so arrow keys work immediately
+        # Set focus to the attachments list after widgets are created so arrow keys work immediately
         self.after(100, self._focus_attachments_box)
     
     def _create_widgets(self):
         """Create UI widgets for the email dialog."""
         # Title
-        title_label = tk.Label(
-            self, 
-            text="Send Email via Outlook", 
-            font=("Arial", 14, "bold"), 
-            bg="#ecf0f1", 
-            fg="#2c3e50"
-        )
+        title_label = _mk_label(self, "Send Email via Outlook", **_TITLE_STYLE)
         title_label.pack(pady=8)
         
         # Subject field
-        subject_frame = tk.Frame(self, bg="#ecf0f1")
+        subject_frame = tk.Frame(self, bg=_BG)
         subject_frame.pack(fill="x", padx=15, pady=4)
-        tk.Label(
-            subject_frame, 
-            text="Subject:", 
-            font=("Arial", 10), 
-            bg="#ecf0f1", 
-            fg="#2c3e50",
-            width=10,
-            anchor="w"
-        ).pack(side="left")
+        _mk_label(subject_frame, "Subject:", width=10, anchor="w").pack(side="left")
         self.subject_var = tk.StringVar(value=self.default_subject)
-        subject_entry = tk.Entry(subject_frame, textvariable=self.subject_var, width=40, font=("Arial", 9))
+        subject_entry = tk.Entry(subject_frame, textvariable=self.subject_var, width=40, font=_FONT)
         subject_entry.pack(side="left", padx=5)
         
         # Email field - supports multiple emails (comma or semicolon separated)
         # Users can copy-paste multiple email addresses in this field
-        email_frame = tk.Frame(self, bg="#ecf0f1")
+        email_frame = tk.Frame(self, bg=_BG)
         email_frame.pack(fill="x", padx=15, pady=4)
-        tk.Label(
-            email_frame, 
-            text="Email To:", 
-            font=("Arial", 10), 
-            bg="#ecf0f1", 
-            fg="#2c3e50",
-            width=10,
-            anchor="w"
-        ).pack(side="left")
+        _mk_label(email_frame, "Email To:", width=10, anchor="w").pack(side="left")
         self.email_var = tk.StringVar(value=self.default_email)
-        email_entry = tk.Entry(email_frame, textvariable=self.email_var, width=40, font=("Arial", 9))
+        email_entry = tk.Entry(email_frame, textvariable=self.email_var, width=40, font=_FONT)
         email_entry.pack(side="left", padx=5)
         
         # Helper label for multiple emails (small text below the entry)
-        email_help_frame = tk.Frame(self, bg="#ecf0f1")
+        email_help_frame = tk.Frame(self, bg=_BG)
         email_help_frame.pack(fill="x", padx=15, pady=(0, 4))
-        tk.Label(
+        _mk_label(
             email_help_frame,
-            text="Note: Multiple emails can be pasted here (comma or semicolon separated)",
-            font=("Arial", 8),
-            bg="#ecf0f1",
+            "Note: Multiple emails can be pasted here (comma or semicolon separated)",
+            font=_NOTE_FONT,
             fg="#7f8c8d",
             anchor="w"
         ).pack(side="left", padx=(85, 0))  # Align with email entry field
         
         # Body field - compact
-        body_frame = tk.Frame(self, bg="#ecf0f1")
+        body_frame = tk.Frame(self, bg=_BG)
         body_frame.pack(fill="x", padx=15, pady=4)
-        tk.Label(
-            body_frame, 
-            text="Body:", 
-            font=("Arial", 10), 
-            bg="#ecf0f1", 
-            fg="#2c3e50",
-            width=10,
-            anchor="nw"
-        ).pack(side="left", anchor="n", pady=(3, 0))
+        _mk_label(body_frame, "Body:", width=10, anchor="nw").pack(side="left", anchor="n", pady=(3, 0))
         
         body_text_frame = tk.Frame(body_frame, bg="#ffffff", highlightthickness=1, highlightbackground="#bdc3c7", height=50)
         body_text_frame.pack(side="left", fill="both", expand=True, padx=5)
@@ -146,10 +176,10 @@ class EmailDialog(tk.Toplevel):
             body_text_frame,
             width=40,
             height=2,
-            font=("Arial", 9),
+            font=_FONT,
             wrap=tk.WORD,
             bg="#ffffff",
-            fg="#2c3e50",
+            fg=_FG,
             relief="flat",
             padx=3,
             pady=3
@@ -161,192 +191,67 @@ class EmailDialog(tk.Toplevel):
             self.body_text.insert("1.0", self.default_body)
         
         # Email sending option checkbox
-        email_option_frame = tk.Frame(self, bg="#ecf0f1")
+        email_option_frame = tk.Frame(self, bg=_BG)
         email_option_frame.pack(fill="x", padx=15, pady=4)
         self.separate_emails_var = tk.BooleanVar(value=False)
         tk.Checkbutton(
             email_option_frame,
             text="Send each file in a separate email",
             variable=self.separate_emails_var,
-            font=("Arial", 9),
-            bg="#ecf0f1",
-            fg="#2c3e50",
-            selectcolor="#ecf0f1"
+            font=_FONT,
+            bg=_BG,
+            fg=_FG,
+            selectcolor=_BG
         ).pack(side="left")
         
         # File selection label
-        file_label_frame = tk.Frame(self, bg="#ecf0f1")
+        file_label_frame = tk.Frame(self, bg=_BG)
         file_label_frame.pack(fill="x", padx=15, pady=(6, 3))
-        tk.Label(
-            file_label_frame, 
-            text="Attachments:", 
-            font=("Arial", 10, "bold"), 
-            bg="#ecf0f1", 
-            fg="#2c3e50"
-        ).pack(side="left")
+        _mk_label(file_label_frame, "Attachments:", font=_BOLD_FONT).pack(side="left")
         
         # File selection frame with scrollbar - fixed height
-        file_selection_frame = tk.Frame(self, bg="#ecf0f1", height=150)
+        file_selection_frame = tk.Frame(self, bg=_BG, height=150)
         file_selection_frame.pack(fill="x", padx=15, pady=3)
         file_selection_frame.pack_propagate(False)
         
-        # Create canvas and scrollbar for file list - cursor set directly on widgets (simple approach like dashboard.py)
-        canvas = tk.Canvas(file_selection_frame, bg="#ffffff", highlightthickness=1, highlightbackground="#bdc3c7", height=150, cursor="hand2")
-        scrollbar = tk.Scrollbar(file_selection_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#ffffff", cursor="hand2")  # Also set cursor directly on frame (like dashboard.py)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Enable keyboard arrow key scrolling
+        # One Treeview row per file with a checkbox glyph. The Treeview only
+        # draws the rows in view, so ZIPs with thousands of entries open as
+        # fast as small ones (a Checkbutton per file did not scale).
+        file_tree = ttk.Treeview(file_selection_frame, show="tree", selectmode="none", cursor="hand2")
+        file_tree.column("#0", stretch=True)
+        file_tree.tag_configure("file", font=_FONT)
+        scrollbar = ttk.Scrollbar(file_selection_frame, orient="vertical", command=file_tree.yview)
+        file_tree.configure(yscrollcommand=scrollbar.set)
+        
+        # Enable keyboard arrow key scrolling. Held-key repeats are gathered
+        # and applied as one scroll per idle cycle.
         def _on_arrow_up(event):
-            canvas.yview_scroll(-1, "units")
+            self._queue_scroll(-1)
             return "break"  # Prevent default behavior
         
         def _on_arrow_down(event):
-            canvas.yview_scroll(1, "units")
+            self._queue_scroll(1)
             return "break"  # Prevent default behavior
         
-        # Make canvas focusable and bind arrow keys
-        canvas.config(takefocus=True)
-        canvas.bind("<Up>", _on_arrow_up)
-        canvas.bind("<Down>", _on_arrow_down)
-        canvas.bind("<Button-1>", lambda e: canvas.focus_set())  # Focus on click
+        file_tree.bind("<Up>", _on_arrow_up)
+        file_tree.bind("<Down>", _on_arrow_down)
+        file_tree.bind("<Button-1>", self._on_file_click)
         
-        # Store handlers and canvas reference for use in other bindings
+        # Store handlers and tree reference for use in other bindings
         self._arrow_up_handler = _on_arrow_up
         self._arrow_down_handler = _on_arrow_down
-        self.attachments_canvas = canvas  # Store canvas reference for focus and global bindings
-        
-        # Enable mouse wheel scrolling and cursor on canvas
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            # CRITICAL: Always set cursor to hand2 when scrolling (works even in empty space)
-            canvas.config(cursor="hand2")
-        
-        def _bind_to_mousewheel(event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-            canvas.config(cursor="hand2")  # Set cursor when entering canvas area
-        
-        def _unbind_from_mousewheel(event):
-            canvas.unbind_all("<MouseWheel>")
-            # Don't reset cursor immediately - check if mouse is still in canvas area
-            # The cursor should stay hand2 as long as mouse is anywhere in attachments area
-        
-        canvas.bind("<Enter>", _bind_to_mousewheel)
-        canvas.bind("<Leave>", _unbind_from_mousewheel)
-        
-        # Bind mouse motion on canvas to ensure cursor stays
-        def _on_canvas_motion(event):
-            canvas.config(cursor="hand2")
+        self.file_tree = file_tree  # Store tree reference for focus and toggling
         
-        canvas.bind("<Motion>", _on_canvas_motion)
+        # Add a row for each file (all selected by default). Inserting at
+        # the head is constant time, 'end' walks the rows added so far.
+        for filename in reversed(self._file_names):
+            file_tree.insert("", 0, iid=filename, text=self._file_row_text(filename, True), tags=("file",))
         
-        # Bind mouse motion on scrollable frame to change canvas cursor - critical for empty spaces
-        def _on_frame_motion(event):
-            # Always set canvas cursor when mouse moves over frame (even empty space)
-            canvas.config(cursor="hand2")
-        
-        # Also bind to frame enter/leave to maintain cursor
-        def _on_frame_enter(event):
-            canvas.config(cursor="hand2")
-        
-        def _on_frame_leave(event):
-            # When leaving frame, check if we're still in canvas area
-            # If yes, keep cursor; if no, reset it
-            try:
-                x, y = self.winfo_pointerx(), self.winfo_pointery()
-                widget_x = canvas.winfo_rootx()
-                widget_y = canvas.winfo_rooty()
-                widget_width = canvas.winfo_width()
-                widget_height = canvas.winfo_height()
-                
-                # If mouse is still within canvas bounds, keep cursor
-                if widget_x <= x <= widget_x + widget_width and widget_y <= y <= widget_y + widget_height:
-                    canvas.config(cursor="hand2")
-                else:
-                    canvas.config(cursor="")
-            except:
-                # If calculation fails, keep cursor as hand2 to be safe
-                canvas.config(cursor="hand2")
-        
-        # Aggressively bind to frame - these should fire for ANY mouse movement in frame
-        scrollable_frame.bind("<Motion>", _on_frame_motion)  # Motion events on frame (empty space)
-        scrollable_frame.bind("<Enter>", _on_frame_enter)
-        scrollable_frame.bind("<Leave>", _on_frame_leave)
-        
-        # Also bind to all mouse events on frame to ensure cursor is always hand2
-        scrollable_frame.bind("<Button-1>", lambda e: canvas.config(cursor="hand2"))
-        scrollable_frame.bind("<ButtonRelease-1>", lambda e: canvas.config(cursor="hand2"))
-        
-        # Bind arrow keys to scrollable_frame as well (so they work when frame has focus)
-        scrollable_frame.bind("<Up>", lambda e: self._arrow_up_handler(e))
-        scrollable_frame.bind("<Down>", lambda e: self._arrow_down_handler(e))
-        scrollable_frame.bind("<Button-1>", lambda e: canvas.focus_set())  # Focus canvas on click
-        
-        # Add checkboxes for each file
-        for filename in self.file_list:
-            var = tk.BooleanVar(value=True)  # Default: all files selected
-            self.file_vars[filename] = var
-            checkbox = tk.Checkbutton(
-                scrollable_frame,
-                text=filename,
-                variable=var,
-                font=("Arial", 9),
-                bg="#ffffff",
-                fg="#2c3e50",
-                selectcolor="#ffffff",
-                anchor="w",
-                padx=5,
-                pady=2,
-                cursor="hand2"  # Set cursor directly on checkbox (works for both box and text)
-            )
-            checkbox.pack(fill="x", padx=8, pady=1)
-            
-            # Bind ALL events to ensure canvas cursor is ALWAYS hand2 when in attachments area
-            def _on_checkbox_motion(event):
-                # Always set canvas cursor when mouse moves over checkbox
-                canvas.config(cursor="hand2")
-            
-            def _on_checkbox_enter(event):
-                canvas.config(cursor="hand2")
-            
-            def _on_checkbox_leave(event):
-                # When leaving checkbox, immediately set canvas cursor to hand2
-                # The frame motion handler will also fire, ensuring cursor stays hand2
-                canvas.config(cursor="hand2")
-                # Also trigger frame motion to ensure cursor is set even if moving to empty space
-                try:
-                    x, y = self.winfo_pointerx(), self.winfo_pointery()
-                    # Convert to canvas coordinates to check if still in canvas
-                    canvas_x = canvas.winfo_rootx()
-                    canvas_y = canvas.winfo_rooty()
-                    if canvas_x <= x <= canvas_x + canvas.winfo_width() and canvas_y <= y <= canvas_y + canvas.winfo_height():
-                        canvas.config(cursor="hand2")
-                except:
-                    canvas.config(cursor="hand2")
-            
-            # Bind to checkbox with aggressive cursor setting - use add="+" to not override
-            checkbox.bind("<Motion>", _on_checkbox_motion, add="+")
-            checkbox.bind("<Enter>", _on_checkbox_enter, add="+")
-            checkbox.bind("<Leave>", _on_checkbox_leave, add="+")
-            # Also bind to Button-1, ButtonRelease-1, etc. to maintain cursor
-            checkbox.bind("<Button-1>", lambda e: canvas.config(cursor="hand2"))
-            checkbox.bind("<ButtonRelease-1>", lambda e: canvas.config(cursor="hand2"))
-            # Bind arrow keys to checkboxes for scrolling
-            checkbox.bind("<Up>", lambda e: self._arrow_up_handler(e))
-            checkbox.bind("<Down>", lambda e: self._arrow_down_handler(e))
-        
-        canvas.pack(side="left", fill="both", expand=True)
+        file_tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Buttons frame - ensure it's always visible at bottom
-        buttons_frame = tk.Frame(self, bg="#ecf0f1", height=60)
+        buttons_frame = tk.Frame(self, bg=_BG, height=60)
         buttons_frame.pack(side="bottom", fill="x", padx=15, pady=(8, 12))
         buttons_frame.pack_propagate(False)
         
@@ -360,10 +265,11 @@ class EmailDialog(tk.Toplevel):
             relief="flat",
             padx=18,
             pady=6,
-            font=("Arial", 10, "bold"),
+            font=_BOLD_FONT,
             cursor="hand2"
         )
         cancel_btn.pack(side="right", padx=(8, 0))
+        self._cancel_btn = cancel_btn
         
         # Send Mail button
         send_btn = tk.Button(
@@ -375,19 +281,51 @@ class EmailDialog(tk.Toplevel):
             relief="flat",
             padx=18,
             pady=6,
-            font=("Arial", 10, "bold"),
+            font=_BOLD_FONT,
             cursor="hand2"
         )
         send_btn.pack(side="right", padx=(0, 8))
+        self._send_btn = send_btn
     
     def _focus_attachments_box(self):
-        """Set focus to attachments canvas so arrow keys work immediately."""
-        if hasattr(self, 'attachments_canvas'):
+        """Set focus to attachments list so arrow keys work immediately."""
+        if hasattr(self, 'file_tree'):
             try:
-                self.attachments_canvas.focus_set()
+                self.file_tree.focus_set()
             except:
                 pass
     
+    @staticmethod
+    def _file_row_text(filename, selected):
+        """Attachment row label: checkbox glyph followed by the file name."""
+        return f"{'☑' if selected else '☐'} {filename}"
+    
+    def _on_file_click(self, event):
+        """Toggle the attachment under the pointer."""
+        self.file_tree.focus_set()
+        filename = self.file_tree.identify_row(event.y)
+        if filename:
+            selected = filename not in self._selected
+            if selected:
+                self._selected.add(filename)
+            else:
+                self._selected.discard(filename)
+            self.file_tree.item(filename, text=self._file_row_text(filename, selected))
+        return "break"
+    
+    def _queue_scroll(self, units):
+        """Add to the pending attachment-list scroll."""
+        self._pending_units += units
+        if self._pending_scroll is None:
+            self._pending_scroll = self.after_idle(self._flush_scroll)
+    
+    def _flush_scroll(self):
+        """Apply the arrow-key scroll gathered since the last idle cycle in one step."""
+        units, self._pending_units = self._pending_units, 0
+        self._pending_scroll = None
+        if units:
+            self.file_tree.yview_scroll(units, "units")
+    
     def _on_dialog_arrow_up(self, event):
         """Handle arrow up key when pressed anywhere in dialog (except text fields)."""
         # Only scroll if not in a text entry field (subject, email, body)
@@ -414,6 +352,9 @@ class EmailDialog(tk.Toplevel):
     
     def _on_cancel(self):
         """Handle cancel button click."""
+        if self._sending:
+            # The worker is still reading the extracted files
+            return
         self._cleanup_temp_dir()
         self.destroy()
     
@@ -437,102 +378,32 @@ class EmailDialog(tk.Toplevel):
         Returns:
             list: List of paths to extracted files, or empty list on error
         """
-        extracted_paths = []
+        import zipfile
         
         try:
             os.makedirs(output_dir, exist_ok=True)
             
             # Extract selected files from ZIP
             with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                zip_file_list = zip_ref.namelist()
+                # Name -> ZipInfo from the directory ZipFile has just read, so
+                # extraction is handed the entries rather than looking names up
+                zip_infos = {info.filename: info for info in zip_ref.infolist()}
+                present = [filename for filename in selected_filenames if filename in zip_infos]
+                missing = [filename for filename in selected_filenames if filename not in zip_infos]
                 
-                # Extract only selected files
-                for filename in selected_filenames:
-                    if filename in zip_file_list:
-                        extracted_path = os.path.join(output_dir, filename)
-                        zip_ref.extract(filename, output_dir)
-                        extracted_paths.append(extracted_path)
-                    else:
-                        messagebox.showwarning("Warning", f"File '{filename}' not found in ZIP archive.")
+                # Extract only selected files, in one call
+                zip_ref.extractall(output_dir, members=[zip_infos[filename] for filename in present])
             
-            return extracted_paths
+            # One warning for all missing files rather than a dialog each
+            if missing:
+                messagebox.showwarning("Warning", "Files not found in ZIP archive:\n" + "\n".join(missing))
+            
+            return [os.path.join(output_dir, filename) for filename in present]
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to extract files from ZIP: {str(e)}")
             return []
     
-    def _parse_emails(self, email_text):
-        """
-        Parse email addresses from text input.
-        Supports multiple formats:
-        - One email per line
-        - Comma-separated emails
-        - Semicolon-separated emails
-        - Mixed formats
-        
-        Args:
-            email_text (str): Raw email input text
-            
-        Returns:
-            list: List of valid email addresses (stripped and cleaned)
-        """
-        if not email_text:
-            return []
-        
-        # Replace semicolons with commas for consistent parsing
-        email_text = email_text.replace(";", ",")
-        
-        # Split by both commas and newlines
-        emails = []
-        for line in email_text.split("\n"):
-            for email in line.split(","):
-                email = email.strip()
-                if email:  # Only add non-empty emails
-                    emails.append(email)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_emails = []
-        for email in emails:
-            if email not in seen:
-                seen.add(email)
-                unique_emails.append(email)
-        
-        return unique_emails
-    
-    def _validate_email(self, email):
-        """
-        Basic email validation.
-        
-        Args:
-            email (str): Email address to validate
-            
-        Returns:
-            bool: True if email appears valid, False otherwise
-        """
-        if not email or not email.strip():
-            return False
-        
-        email = email.strip()
-        
-        # Basic validation: must contain @ and have a domain with at least one dot
-        if "@" not in email:
-            return False
-        
-        parts = email.split("@")
-        if len(parts) != 2:
-            return False
-        
-        local, domain = parts
-        if not local or not domain:
-            return False
-        
-        # Domain must contain at least one dot
-        if "." not in domain:
-            return False
-        
-        return True
-    
     def _on_send(self):
         """Handle send mail button click."""
         # Get subject and email
@@ -548,19 +419,13 @@ class EmailDialog(tk.Toplevel):
             messagebox.showwarning("Validation Error", "Please enter at least one email address.")
             return
         
-        # Parse multiple emails
-        email_list = self._parse_emails(email_text)
+        # Parse and validate multiple emails
+        email_list, invalid_emails = _parse_and_validate(email_text)
         
-        if not email_list:
+        if not email_list and not invalid_emails:
             messagebox.showwarning("Validation Error", "Please enter at least one valid email address.")
             return
         
-        # Validate all emails
-        invalid_emails = []
-        for email in email_list:
-            if not self._validate_email(email):
-                invalid_emails.append(email)
-        
         if invalid_emails:
             messagebox.showwarning(
                 "Validation Error", 
@@ -572,7 +437,7 @@ class EmailDialog(tk.Toplevel):
         email = "; ".join(email_list)
         
         # Get selected files
-        selected_files = [filename for filename, var in self.file_vars.items() if var.get()]
+        selected_files = [filename for filename in self._file_names if filename in self._selected]
         
         if not selected_files:
             messagebox.showwarning("Validation Error", "Please select at least one file to send.")
@@ -580,6 +445,11 @@ class EmailDialog(tk.Toplevel):
         
         # Extract selected files from ZIP to temporary directory
         try:
+            # Imported on first send so opening (or cancelling) the dialog
+            # does not load the Outlook/COM bindings
+            import tempfile
+            from outlook_email import send_outlook_email
+            
             self.temp_dir = tempfile.mkdtemp()
             extracted_paths = self._extract_files_from_zip(selected_files, self.temp_dir)
             
@@ -595,41 +465,15 @@ class EmailDialog(tk.Toplevel):
             send_separate = self.separate_emails_var.get()
             
             if send_separate:
-                # Send each file in a separate email
-                success_count = 0
-                failed_count = 0
-                
-                for i, file_path in enumerate(extracted_paths):
-                    # Use original subject as entered (no filename modification)
-                    success = send_outlook_email(
-                        recipient=email,
-                        subject=subject,
-                        body=body,
-                        attachment_paths=[file_path]  # Single file per email
-                    )
-                    
-                    if success:
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                
-                # Show summary
-                if failed_count == 0:
-                    messagebox.showinfo(
-                        "Success",
-                        f"Successfully processed {success_count} email(s).\n\n"
-                        f"Each file was sent in a separate email.\n"
-                        f"If Outlook opened the emails, please review and send them manually."
-                    )
-                    self.destroy()
-                else:
-                    messagebox.showwarning(
-                        "Partial Success",
-                        f"Processed {success_count} email(s) successfully.\n"
-                        f"Failed to process {failed_count} email(s).\n\n"
-                        f"Please check Outlook configuration."
-                    )
-                    self._cleanup_temp_dir()
+                # Send each file in a separate email on a worker thread so the
+                # dialog stays responsive; progress comes back through after()
+                self._set_sending(True)
+                self._show_send_progress(0, len(extracted_paths))
+                threading.Thread(
+                    target=self._send_separate_worker,
+                    args=(send_outlook_email, email, subject, body, extracted_paths),
+                    daemon=True
+                ).start()
             else:
                 # Send all files in one email
                 
@@ -659,34 +503,80 @@ class EmailDialog(tk.Toplevel):
             self._cleanup_temp_dir()
             messagebox.showerror("Error", f"Failed to send email: {str(e)}")
     
-    def _get_icon_path(self):
-        """Get the icon path for the email dialog - works for both development and compiled EXE"""
-        if getattr(sys, 'frozen', False):
-            # Running as compiled EXE
-            return os.path.join(sys._MEIPASS, "outlook.png")
+    def _set_sending(self, sending):
+        """Lock the dialog buttons while separate emails are being sent."""
+        self._sending = sending
+        state = tk.DISABLED if sending else tk.NORMAL
+        self._send_btn.config(state=state)
+        self._cancel_btn.config(state=state)
+        if not sending:
+            self._send_btn.config(text="Send Mail")
+    
+    def _show_send_progress(self, done, total):
+        """Show how many of the separate emails have been processed."""
+        self._send_btn.config(text=f"Sending {done}/{total}...")
+    
+    def _send_separate_worker(self, send_outlook_email, email, subject, body, file_paths):
+        """Send one email per file (runs on a worker thread)."""
+        total = len(file_paths)
+        success_count = 0
+        try:
+            # COM has to be initialised on every thread that uses Outlook
+            import pythoncom
+            pythoncom.CoInitialize()
+            try:
+                for done, file_path in enumerate(file_paths, 1):
+                    # Use original subject as entered (no filename modification)
+                    if send_outlook_email(
+                        recipient=email,
+                        subject=subject,
+                        body=body,
+                        attachment_paths=[file_path]  # Single file per email
+                    ):
+                        success_count += 1
+                    self.after(0, self._show_send_progress, done, total)
+            finally:
+                pythoncom.CoUninitialize()
+        finally:
+            self.after(0, self._finish_separate_send, success_count, total - success_count)
+    
+    def _finish_separate_send(self, success_count, failed_count):
+        """Summarise the separate sends back on the Tk thread."""
+        self._set_sending(False)
+        if failed_count == 0:
+            messagebox.showinfo(
+                "Success",
+                f"Successfully processed {success_count} email(s).\n\n"
+                f"Each file was sent in a separate email.\n"
+                f"If Outlook opened the emails, please review and send them manually."
+            )
+            self.destroy()
         else:
-            # Running as script - try multiple possible locations
-            possible_paths = [
-                "outlook.png",  # Same directory (root)
-                "../outlook.png",  # Parent directory
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "outlook.png")  # Root directory
-            ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    return os.path.abspath(path)
-            return None
+            messagebox.showwarning(
+                "Partial Success",
+                f"Processed {success_count} email(s) successfully.\n"
+                f"Failed to process {failed_count} email(s).\n\n"
+                f"Please check Outlook configuration."
+            )
+            self._cleanup_temp_dir()
+    
+    def _get_icon_path(self):
+        """Get the icon path for the email dialog (resolved once at import)"""
+        return _ICON_PATH
     
     def _load_icon(self):
         """Load outlook.png icon for the dialog"""
+        global _ICON_PHOTO
         try:
             icon_path = self._get_icon_path()
-            if icon_path and os.path.exists(icon_path):
+            if icon_path:
                 # Use iconphoto for PNG files (works better than iconbitmap)
                 try:
-                    from PIL import Image, ImageTk
-                    icon_image = Image.open(icon_path)
-                    icon_photo = ImageTk.PhotoImage(icon_image)
-                    self.iconphoto(False, icon_photo)
+                    # Decode the PNG once and reuse the Tk image on later opens
+                    if _ICON_PHOTO is None:
+                        from PIL import Image, ImageTk
+                        _ICON_PHOTO = ImageTk.PhotoImage(Image.open(icon_path))
+                    self.iconphoto(False, _ICON_PHOTO)
                 except Exception:
                     pass
         except Exception:
@@ -694,6 +584,31 @@ class EmailDialog(tk.Toplevel):
     
     def destroy(self):
         """Override destroy to clean up temporary directory."""
+        if self._pending_scroll is not None:
+            self.after_cancel(self._pending_scroll)
+            self._pending_scroll = None
         self._cleanup_temp_dir()
         super().destroy()
 
+
+def _resolve_icon_path():
+    """Locate outlook.png - works for both development and compiled EXE"""
+    if getattr(sys, 'frozen', False):
+        # Running as compiled EXE
+        path = os.path.join(sys._MEIPASS, "outlook.png")
+        return path if os.path.exists(path) else None
+    # Running as script - try multiple possible locations
+    possible_paths = [
+        "outlook.png",  # Same directory (root)
+        "../outlook.png",  # Parent directory
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "outlook.png")  # Root directory
+    ]
+    for path in possible_paths:
+        if os.path.exists(path):
+            return os.path.abspath(path)
+    return None
+
+
+_ICON_PATH = _resolve_icon_path()
+# Decoded icon, created on the first dialog open
+_ICON_PHOTO = None
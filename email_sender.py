@@ -16,6 +16,27 @@ from datetime import datetime
 import traceback
 
 
+# Parsed config per config file path, with the (mtime, size) it was read at,
+# so every EmailSender created in a session doesn't re-parse an unchanged file
+_config_cache = {}
+
+
+def _file_signature(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_config(config_file):
+    """Parse config_file, reusing the last parse while the file is unchanged"""
+    signature = _file_signature(config_file)
+    cached = _config_cache.get(config_file)
+    if cached is None or cached[0] != signature:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            cached = _config_cache[config_file] = (signature, json.load(f))
+    # Each sender gets its own copy to update
+    return dict(cached[1])
+
+
 class EmailSender:
     """Dynamic email sender class with comprehensive functionality"""
     
@@ -31,8 +52,7 @@ class EmailSender:
         """Load email configuration from JSON file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _read_config(self.config_file)
             else:
                 # Create default configuration
                 default_config = {
@@ -63,6 +83,8 @@ class EmailSender:
             config_to_save = config or self.config
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config_to_save, f, indent=2, ensure_ascii=False)
+            # What was just written is the current parse of the file
+            _config_cache[self.config_file] = (_file_signature(self.config_file), dict(config_to_save))
         except Exception as e:
             print(f"Error saving email config: {e}")
     
@@ -129,8 +129,9 @@ class PCMApplication:
         # Processing pages
         self._create_processing_pages()
         
-        # Email configuration page
-        self._create_email_config_page()
+        # Email configuration page - built the first time it is shown, so
+        # users who never open it don't pay for its widgets
+        self._lazy_pages = {'email_config': self._create_email_config_page}
         
         # Settings page
     
@@ -304,6 +305,10 @@ class PCMApplication:
     # Page management
     def show_page(self, page_name):
         """Show the selected page and hide others"""
+        create_page = self._lazy_pages.pop(page_name, None)
+        if create_page is not None:
+            create_page()
+        
         for page in self.pages.values():
             if hasattr(page, 'pack_forget'):
                 page.pack_forget()
@@ -496,6 +501,9 @@ class PCMApplication:
                 f"📊 Processing Results:\n{result}\n\n"
                 f"💡 Tip: Individual encrypted files created for each CP code (no totals by default)"
             )
+        # The processor reads (and may add to) master_passwords.json, so
+        # recent CP code edits must be on disk first
+        self._flush_cp_codes()
         self._handle_process('client_position', 'client_position', "Process Client Position", _msg)
 
     def _sync_cash_collateral(self, collateral_path):
@@ -514,6 +522,9 @@ class PCMApplication:
             self.message_handler.show_error("Cash Collateral Sync", "Client position processor is unavailable.")
             return
 
+        # Write pending CP code edits before the sync rewrites the file, so
+        # that a late auto-save cannot undo the sync
+        self._flush_cp_codes()
         try:
             new_entries = processor.sync_collateral_passwords(path)
         except Exception as exc:
@@ -533,6 +544,12 @@ class PCMApplication:
         )
         self.message_handler.show_success("Cash Collateral Sync", success_message)
 
+    def _flush_cp_codes(self):
+        """Make the client position page write its pending CP code auto-save"""
+        client_page = self.pages.get('client_position')
+        if client_page and hasattr(client_page, 'flush_pending_save'):
+            client_page.flush_pending_save()
+
     def _process_exercise_assignment(self):
         """Process exercise assignment report"""
         # Clear any existing success message
@@ -18,7 +18,7 @@ import traceback
 import glob
 import cons_header
 from client_position_page import load_passwords
-from db_manager import insert_report
+from db_manager import insert_report, insert_report_file
 from physical_settlement_files import build_dict, segregate_excel_by_column, create_segregated_file_with_summary
 
 import json
@@ -476,13 +476,10 @@ class NMASSAllocationProcessor(BaseProcessor):
             zipf.write(file2_path, os.path.basename(file2_path))
             zipf.write(output_file, os.path.basename(output_file))
 
-        # Read ZIP as binary and insert into DB
-        with open(zip_path, 'rb') as f:
-            zip_blob = f.read()
-
+        # Stream ZIP into DB
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        insert_report(self.db_path, report_type=cons_header.LEDGER, 
-                     created_at=timestamp, modified_at=timestamp, report_blob=zip_blob)
+        insert_report_file(self.db_path, report_type=cons_header.LEDGER, 
+                          created_at=timestamp, modified_at=timestamp, file_path=zip_path)
 
 
 class ObligationSettlementProcessor(BaseProcessor):
@@ -570,12 +567,9 @@ class ObligationSettlementProcessor(BaseProcessor):
             zipf.write(output_file, os.path.basename(output_file))
 
         # Insert ZIP into DB
-        with open(zip_path, 'rb') as f:
-            zip_blob = f.read()
-        
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        insert_report(self.db_path, report_type="PHYSICAL_SETTLEMENT", 
-                     created_at=timestamp, modified_at=timestamp, report_blob=zip_blob)
+        insert_report_file(self.db_path, report_type="PHYSICAL_SETTLEMENT", 
+                          created_at=timestamp, modified_at=timestamp, file_path=zip_path)
 
 
 class SegregationReportProcessor(BaseProcessor):
@@ -651,7 +645,7 @@ class SegregationReportProcessor(BaseProcessor):
         """Process all segregation files and generate the final report"""
         try:
             # Import segregation functions
-            from segregation import read_file, write_file, build_cp_lookup
+            from segregation import read_file, read_file_cached, write_file, build_cp_lookup, build_collateral_valuation_lookup
             from CONSTANT_SEGREGATION import segregation_headers, A, B, C, D, E, F, G, H, I, J, K, L, O, P, AD, AV, AG, AW, AH, AX, BB, BD, BF, AT
             
             # Format date for output
@@ -659,7 +653,7 @@ class SegregationReportProcessor(BaseProcessor):
             
             # Read CP Master files
             try:
-                df_fo = read_file(f_cp_master)
+                df_fo = read_file_cached(f_cp_master)
                 cp_codes_fo = df_fo["CP Code"].tolist()
                 pan_fo = df_fo["PAN Number"].tolist()
             except Exception as e:
@@ -669,7 +663,7 @@ class SegregationReportProcessor(BaseProcessor):
                     raise Exception(f"❌ Error reading F_CPMaster_data file:\n\nPlease check if the correct F_CPMaster_data file is attached.\n\nTechnical details: {str(e)}")
             
             try:
-                df_cd = read_file(x_cp_master)
+                df_cd = read_file_cached(x_cp_master)
                 cp_codes_cd = df_cd["CP Code"].tolist()
                 pan_cd = df_cd["PAN Number"].tolist()
             except Exception as e:
@@ -712,43 +706,15 @@ class SegregationReportProcessor(BaseProcessor):
             
             # Read Collateral Valuation Report CD
             try:
-                df_valuation_cd = read_file(collateral_valuation_cds, header_row=9, usecols="B:H")
-                cd_collateral_valuation_lookup = {}
-
-                for _, row in df_valuation_cd.iterrows():
-                    client_code = row["ClientCode"]
-                    cash_eq = row["CashEquivalent"]
-                    non_cash = row["NonCash"]
-                    
-                    if client_code in cd_collateral_valuation_lookup:
-                        cd_collateral_valuation_lookup[client_code]["CashEquivalent"] = cash_eq
-                        cd_collateral_valuation_lookup[client_code]["NonCash"] = non_cash
-                    else:
-                        cd_collateral_valuation_lookup[client_code] = {
-                            "CashEquivalent": cash_eq,
-                            "NonCash": non_cash
-                        }
+                df_valuation_cd = read_file_cached(collateral_valuation_cds, header_row=9, usecols="B:H")
+                cd_collateral_valuation_lookup = build_collateral_valuation_lookup(df_valuation_cd)
             except Exception as e:
                 raise Exception(f"❌ Error reading Collateral Valuation Report CDS file:\n\nPlease check if the correct Collateral Valuation Report CDS file is attached.\n\nTechnical details: {str(e)}")
 
             # Read Collateral Valuation Report FO
             try:
-                df_valuation_fo = read_file(collateral_valuation_fno, header_row=9, usecols="B:H")
-                fo_collateral_valuation_lookup = {}
-                
-                for _, row in df_valuation_fo.iterrows():
-                    client_code = row["ClientCode"]
-                    cash_eq = row["CashEquivalent"]
-                    non_cash = row["NonCash"]
-                    
-                    if client_code in fo_collateral_valuation_lookup:
-                        fo_collateral_valuation_lookup[client_code]["CashEquivalent"] = cash_eq
-                        fo_collateral_valuation_lookup[client_code]["NonCash"] = non_cash
-                    else:
-                        fo_collateral_valuation_lookup[client_code] = {
-                            "CashEquivalent": cash_eq,
-                            "NonCash": non_cash
-                        }
+                df_valuation_fo = read_file_cached(collateral_valuation_fno, header_row=9, usecols="B:H")
+                fo_collateral_valuation_lookup = build_collateral_valuation_lookup(df_valuation_fo)
             except Exception as e:
                 raise Exception(f"❌ Error reading Collateral Valuation Report FNO file:\n\nPlease check if the correct Collateral Valuation Report FNO file is attached.\n\nTechnical details: {str(e)}")
             
@@ -773,6 +739,15 @@ class SegregationReportProcessor(BaseProcessor):
             # av_records = self._get_master_records(av=True) at_records = self._get_master_records(at=True)
             # all_records = self._get_master_records(all_records=True)
             
+            # Index AV records by (CP Code, Segment) once instead of scanning them per data record
+            av_index = {}
+            for av_record in av_records or []:
+                try:
+                    av_key = ((av_record.get(D) or "").strip(), (av_record.get(H) or "").strip())
+                except Exception:
+                    continue
+                av_index.setdefault(av_key, av_record)  # keep first match
+
             for data_record in data:
                 try:
                     cp_key = str(data_record.get(D, "")).strip()
@@ -780,17 +755,15 @@ class SegregationReportProcessor(BaseProcessor):
                     if not (cp_key and seg_key):
                         continue
 
-                    for av_record in av_records or []:
-                        av_cp = (av_record.get(D) or "").strip()
-                        av_seg = (av_record.get(H) or "").strip()
-                        if av_cp == cp_key and av_seg == seg_key:
-                            av_val_raw = av_record.get("av_value") if "av_value" in av_record else av_record.get(AV)
-                            if av_val_raw not in (None, ""):
-                                try:
-                                    data_record[AV] = float(av_val_raw)
-                                except Exception:
-                                    pass
-                            break  # stop at first match
+                    av_record = av_index.get((cp_key, seg_key))
+                    if av_record is None:
+                        continue
+                    av_val_raw = av_record.get("av_value") if "av_value" in av_record else av_record.get(AV)
+                    if av_val_raw not in (None, ""):
+                        try:
+                            data_record[AV] = float(av_val_raw)
+                        except Exception:
+                            pass
                 except Exception:
                     continue
 
@@ -829,24 +802,18 @@ class SegregationReportProcessor(BaseProcessor):
             # Filter main data and add extra records in correct position
             data = self._segregation_data_filter(data, segregation_headers=segregation_headers[9:], extra_records=extra_records_data)
             
+            # Index AT records by (CP Code, Segment), keeping the first match
+            at_index = {}
+            for at_record in at_records:
+                at_index.setdefault((at_record.get(D, ''), at_record.get(H, '')), at_record)
+
             # Loop through data (list of dictionaries) and apply AT records logic
-            for i, data_record in enumerate(data):
-                # Loop through AT records to find matches
-                for at_record in at_records:
-                    at_cp_code = at_record.get(D, '')
-                    at_segment = at_record.get(H, '')
+            for data_record in data:
+                at_record = at_index.get((data_record.get(D, ''), data_record.get(H, '')))
+                if at_record is not None:
                     at_value = float(at_record.get("at_value", 0))
-                    
-                    # Check if current data record matches AT record criteria
-                    if (data_record.get(D, '') == at_cp_code and 
-                        data_record.get(H, '') == at_segment):
-                        
-                        # Apply AT logic to this data record
-
-                        data_record[AV] = data_record[AD] - at_value
-                        data_record[AT] = at_value
-
-                        break  # Stop at first match
+                    data_record[AV] = data_record[AD] - at_value
+                    data_record[AT] = at_value
             
             if santom_file:
                 try:
@@ -886,38 +853,33 @@ class SegregationReportProcessor(BaseProcessor):
     
     def _process_security_pledge_file(self, sec_pledge):
         """Process security pledge file"""
-        from segregation import read_file, GSEC_HEADER, SRNO,CPCODE,SEGMENT,ISIN,PLEDGE_TYPE,SEC_NAME,MATURITY_DATE,PRICE,QUANTITY,MKT_VALUE,HAIRCUT,HAIRCUT_VALUE,POST_HAIRCUT, D, H
+        from segregation import read_file_cached, is_gsec_used_column, GSEC_HEADER, SRNO,CPCODE,SEGMENT,ISIN,PLEDGE_TYPE,SEC_NAME,MATURITY_DATE,PRICE,QUANTITY,MKT_VALUE,HAIRCUT,HAIRCUT_VALUE,POST_HAIRCUT, D, H
 
-        gsec_df = read_file(
+        gsec_df = read_file_cached(
                         sec_pledge,
                         header_row=0,
+                        usecols=is_gsec_used_column,
                         sheet_name="Valuation_G-Sec"
                     )
         gsec_df.columns = gsec_df.columns.str.strip()  # removes leading/trailing spaces
 
-        _sec_pledge_lookup = {}
+        cp_codes = gsec_df[CPCODE].astype(str).str.strip()
+        segments = gsec_df[SEGMENT].astype(str).str.strip()
+        pledge_types = gsec_df[PLEDGE_TYPE].astype(str).str.strip()
+        post_haircut = pd.to_numeric(gsec_df[POST_HAIRCUT]).fillna(0.0)
 
-        for idx, row in gsec_df.iterrows():
-            cp_code = str(row[CPCODE]).strip()
-            segment = str(row[SEGMENT]).strip()
-            pledge_type = str(row[PLEDGE_TYPE]).strip()
-            post_haircut = float(row[POST_HAIRCUT]) if pd.notna(row[POST_HAIRCUT]) else 0.0
-
-            # Only include FNO + E-Kuber rows
-            if segment == "FNO" and pledge_type == "E-Kuber":
-                if cp_code not in _sec_pledge_lookup:
-                    _sec_pledge_lookup[cp_code] = {
-                        H: segment,
-                        D: cp_code,
-                        "post_haircut": 0.0
-                    }
-                # Add to total
-                _sec_pledge_lookup[cp_code]["post_haircut"] += post_haircut
-        
-        for cp_code in _sec_pledge_lookup:
-            value = _sec_pledge_lookup[cp_code]["post_haircut"]
-            dec_value = Decimal(str(value))  # convert float → Decimal
-            _sec_pledge_lookup[cp_code]["post_haircut"] = dec_value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        # Only include FNO + E-Kuber rows, totalled per CP code in first-seen order
+        mask = (segments == "FNO") & (pledge_types == "E-Kuber")
+        totals = post_haircut[mask].groupby(cp_codes[mask], sort=False).sum()
+
+        _sec_pledge_lookup = {}
+        for cp_code, value in totals.items():
+            dec_value = Decimal(str(float(value)))  # convert float → Decimal
+            _sec_pledge_lookup[cp_code] = {
+                H: "FNO",
+                D: cp_code,
+                "post_haircut": dec_value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            }
             # _sec_pledge_lookup[cp_code]["post_haircut"] = round(
             #     _sec_pledge_lookup[cp_code]["post_haircut"], 2
             # )
@@ -984,7 +946,7 @@ class SegregationReportProcessor(BaseProcessor):
                               cd_collateral_valuation_lookup, fo_collateral_valuation_lookup, 
                               sec_pledge_cp_lookup):
         """Generate report data for both FO and CD segments"""
-        from CONSTANT_SEGREGATION import A, B, C, D, E, F, G, H, I, J, K, L, O, P, AD, AV, AG, AW, AH, AX, BB, BD, BF
+        from CONSTANT_SEGREGATION import A, B, C, D, E, F, G, H, I, J, K, L, O, P, PLEDGE_FANOUT, apply_fanouts, scatter
         
         data = []
         account_type = "C"
@@ -1013,21 +975,13 @@ class SegregationReportProcessor(BaseProcessor):
             }
             
             # Duplicate values in other columns
-            row[AD] = row[K]
-            row[AV] = row[K]
-            row[AG] = row[O]
-            row[AW] = row[O]
-            row[AH] = row[P]
-            row[AX] = row[P]
+            apply_fanouts(row)
 
             # Apply post_haircut only for FO
             if sec_pledge_cp_lookup:
                 pledge_info = sec_pledge_cp_lookup.get(cp)                
                 if pledge_info and pledge_info.get(H) == "FNO":
-                    val = pledge_info.get("post_haircut", 0.0)
-                    row[BB] = val
-                    row[BD] = val
-                    row[BF] = val
+                    scatter(row, PLEDGE_FANOUT, pledge_info.get("post_haircut", 0.0))
 
             data.append(row)
         
@@ -1055,21 +1009,13 @@ class SegregationReportProcessor(BaseProcessor):
             }
             
             # Duplicate values in other columns
-            row[AD] = row[K]
-            row[AV] = row[K]
-            row[AG] = row[O]
-            row[AW] = row[O]
-            row[AH] = row[P]
-            row[AX] = row[P]
+            apply_fanouts(row)
 
             # Apply post_haircut only for FO
             if sec_pledge_cp_lookup:
                 pledge_info = sec_pledge_cp_lookup.get(cp)
                 if pledge_info and pledge_info.get(H) == "CDS":
-                    val = pledge_info.get("post_haircut", 0.0)
-                    row[BB] = val
-                    row[BD] = val
-                    row[BF] = val
+                    scatter(row, PLEDGE_FANOUT, pledge_info.get("post_haircut", 0.0))
             
             data.append(row)
         
@@ -1093,36 +1039,26 @@ class SegregationReportProcessor(BaseProcessor):
         Returns:
             list[dict]: filtered and sorted data
         """
-        from CONSTANT_SEGREGATION import AZ, BL
-        # Step 1: Normalize data - replace blank/NA values with 0 for segregation_headers
-        normalized = []
+        from CONSTANT_SEGREGATION import AZ, BL, NA
+
+        # Step 1: Normalize data in place - replace blank/NA values with 0 for segregation_headers
+        # (other columns are left as-is; rows are not copied)
         for row in data:
-            new_row = {}
-            
-            # Process segregation_headers columns
             for col in segregation_headers:
                 val = row.get(col, 0)  # default if missing
-                if val is None or (isinstance(val, str) and (val.strip() == "" or val.strip().upper() == "NA")):
+                if val is None or (isinstance(val, str) and (val.strip() == "" or val.strip().upper() == NA)):
                     val = 0
-                new_row[col] = val
-
-            # Copy other columns as-is
-            for key, val in row.items():
-                if key not in segregation_headers:
-                    new_row[key] = val
-
-            normalized.append(new_row)
+                row[col] = val
         
         # Step 2 & 3: Sort only by Segment Indicator A to Z
-        seg_sorted = sorted(normalized, key=lambda x: str(x.get(seg_col, "")).strip().upper())
+        seg_sorted = sorted(data, key=lambda x: str(x.get(seg_col, "")).strip().upper())
         
         # Step 4: Move all-zero rows to the end
         def is_all_zero(row):
             """Check if all segregation_headers columns have zero values"""
             return all(
-                (v == 0 or v == "0" or str(v).strip() == "0") 
-                for k, v in row.items() 
-                if k in segregation_headers
+                (v == 0 or v == "0" or str(v).strip() == "0")
+                for v in (row[col] for col in segregation_headers)
             )
 
         # Separate zero and non-zero rows
@@ -1143,13 +1079,13 @@ class SegregationReportProcessor(BaseProcessor):
 
         # Set AZ and BL to "NA" for all records centrally
         for row in final_data:
-            row[AZ] = "NA"
-            row[BL] = "NA"
+            row[AZ] = NA
+            row[BL] = NA
 
         return final_data
 
     def _santom_file_working(self, data, cash_with_ncl, santom_df):
-        from CONSTANT_SEGREGATION import segregation_headers, A, B, C, D, E, F, G, H, I, J, K, L, O, P, AD, AV, AG, AW, AH, AX, BB, BD, BF, AT, AZ, BL
+        from CONSTANT_SEGREGATION import segregation_headers, A, B, C, D, E, F, G, H, I, J, K, L, O, P, AD, AV, AG, AW, AH, AX, BB, BD, BF, AT, AZ, BL, NA
 
         for _, row in santom_df.iterrows():
             record = {}
@@ -1194,9 +1130,9 @@ class SegregationReportProcessor(BaseProcessor):
 
             for row in data:
                 if not row.get(AZ) or pd.isna(row.get(AZ)):  # Checks if AZ is blank or missing
-                    row[AZ] = "NA"
+                    row[AZ] = NA
                 if not row.get(BL) or pd.isna(row.get(BL)):  # Checks if BL is blank or missing
-                    row[BL] = "NA"
+                    row[BL] = NA
 
         return data
 
@@ -1231,12 +1167,9 @@ class SegregationReportProcessor(BaseProcessor):
             zipf.write(output_file, os.path.basename(output_file))
         
         # Insert into database
-        with open(zip_path, 'rb') as f:
-            zip_blob = f.read()
-        
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        insert_report(self.db_path, report_type="SEGREGATION_REPORT", 
-                     created_at=timestamp, modified_at=timestamp, report_blob=zip_blob)
+        insert_report_file(self.db_path, report_type="SEGREGATION_REPORT", 
+                          created_at=timestamp, modified_at=timestamp, file_path=zip_path)
         
         # Delete only the output CSV file after successful ZIP creation and database save
         try:
@@ -1642,12 +1575,9 @@ class ClientPositionProcessor(BaseProcessor):
         
         # Insert ZIP into DB (only if db_path is provided)
         if self.db_path:
-            with open(zip_path, 'rb') as f:
-                zip_blob = f.read()
-            
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            insert_report(self.db_path, report_type="CLIENT_POSITION", 
-                         created_at=timestamp, modified_at=timestamp, report_blob=zip_blob)
+            insert_report_file(self.db_path, report_type="CLIENT_POSITION", 
+                              created_at=timestamp, modified_at=timestamp, file_path=zip_path)
         
         os.remove(zip_path)
 
@@ -3,6 +3,7 @@ import pandas as pd
 import os
 import io
 import warnings
+from functools import lru_cache
 warnings.filterwarnings("ignore")
 
 def calculate_final_effective_value(gross_value, haircut):
@@ -60,6 +61,18 @@ def build_cp_lookup(sec_pledge_lookup):
     # cp_lookup = {cp: round(val, 2) for cp, val in cp_lookup.items()}
     return cp_lookup
 
+def build_collateral_valuation_lookup(df):
+    """
+    Convert a Collateral Valuation Report → {ClientCode: {"CashEquivalent": x, "NonCash": y}}
+
+    Columns are zipped directly instead of walking rows with iterrows();
+    for a duplicate ClientCode the last row wins.
+    """
+    return {
+        client_code: {"CashEquivalent": cash_eq, "NonCash": non_cash}
+        for client_code, cash_eq, non_cash in zip(df["ClientCode"], df["CashEquivalent"], df["NonCash"])
+    }
+
 def read_file(file_path: str, header_row: int = 0, usecols=None, sheet_name=None) -> pd.DataFrame:
     """
     Dynamically read CSV, XLS, or XLSX file into a Pandas DataFrame.
@@ -115,6 +128,45 @@ def read_file(file_path: str, header_row: int = 0, usecols=None, sheet_name=None
     
     return df
 
+def is_gsec_used_column(col) -> bool:
+    """usecols filter for the G-Sec valuation sheet; header cells may carry stray spaces."""
+    return str(col).strip() in GSEC_USED_COLUMNS
+
+@lru_cache(maxsize=8)
+def _read_file_cached(file_path, mtime, header_row, usecols, sheet_name):
+    return read_file(file_path, header_row=header_row, usecols=usecols, sheet_name=sheet_name)
+
+def read_file_cached(file_path: str, header_row: int = 0, usecols=None, sheet_name=None) -> pd.DataFrame:
+    """
+    Same as read_file, but keeps the parsed DataFrame for the process lifetime.
+    
+    The cache is keyed on the file's modification time, so a file that is
+    replaced on disk is parsed again. Callers get their own copy and may
+    modify it freely.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    mtime = os.path.getmtime(file_path)
+    return _read_file_cached(file_path, mtime, header_row, usecols, sheet_name).copy()
+
+def clear_file_cache() -> None:
+    """Drop every DataFrame kept by read_file_cached."""
+    _read_file_cached.cache_clear()
+
+def to_dataframe(data: list[dict], header: list[str]) -> pd.DataFrame:
+    """
+    Build a DataFrame from row dictionaries in a single pass.
+    
+    Parameters:
+        data (list[dict]): List of dictionaries (rows).
+        header (list[str]): Column names in required order.
+        
+    Returns:
+        pd.DataFrame: Columns in header order; missing columns are left empty
+                      and keys outside header are dropped.
+    """
+    return pd.DataFrame(data, columns=list(header))
+
 def write_file(file_path: str, data: list[dict], header: list[str]) -> None:
     """
     Write data into CSV, XLS, or XLSX with a given header order.
@@ -127,14 +179,7 @@ def write_file(file_path: str, data: list[dict], header: list[str]) -> None:
     Returns:
         None
     """
-    # Convert data to DataFrame with given header order
-    df = pd.DataFrame(data)
-    
-    # Reorder columns (fill missing columns with empty values)
-    for col in header:
-        if col not in df.columns:
-            df[col] = None
-    df = df[header]
+    df = to_dataframe(data, header)
     
     # Get file extension
     ext = os.path.splitext(file_path)[1].lower()
@@ -373,13 +418,8 @@ if False:
             BF: sec_pledge_lookup.get(cp, 0)
         }
         
-        # duplicate values in other columns
-        row[AD] = row[K]
-        row[AV] = row[K]
-        row[AG] = row[O]
-        row[AW] = row[O]
-        row[AH] = row[P]
-        row[AX] = row[P]
+        # duplicate values in other columns (see FANOUTS)
+        apply_fanouts(row)
 
         data.append(row)
 
@@ -399,13 +439,8 @@ if False:
             O : cv_lookup["CashEquivalent"],
             P : cv_lookup["NonCash"],
         }
-        # duplicate values in other columns
-        row[AD] = row[K]
-        row[AV] = row[K]
-        row[AG] = row[O]
-        row[AW] = row[O]
-        row[AH] = row[P]
-        row[AX] = row[P]
+        # duplicate values in other columns (see FANOUTS)
+        apply_fanouts(row)
 
         data.append(row)
 